@@ -1,74 +1,146 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 
+import numpy as np
 
-def calculate_matrix_sum(
+SMALL_PRODUCT_LIMIT = 16
+
+Matrix = Union[List[List[float]], np.ndarray]
+
+
+def _as_matrix(matrix: Matrix) -> Optional[np.ndarray]:
+    """
+    Convert a matrix into a two-dimensional float array
+
+    Parameters:
+        matrix (Matrix): Matrix
+
+    Returns:
+        Optional[np.ndarray]: Array view of the matrix, None if it is empty or not 2D
+    """
+    array = np.asarray(matrix, dtype=np.float64)
+    if array.ndim != 2 or array.size == 0:
+        return None
+
+    return array
+
+
+def _small_product(
     matrix_a: List[List[float]], matrix_b: List[List[float]]
 ) -> Optional[List[List[float]]]:
     """
-    Add two matrices
+    Multiply two small matrices given as lists without converting them to arrays
+
+    For tiny inputs converting lists to arrays and back costs more than the
+    multiplication itself. Loops run in i-k-j order, so the innermost loop walks
+    a single row of matrix b and a single row of the result.
 
     Parameters:
         matrix_a (List[List[float]]): First matrix
         matrix_b (List[List[float]]): Second matrix
 
+    Returns:
+        Optional[List[List[float]]]: Product of matrix a and matrix b
+    """
+    if len(matrix_a[0]) != len(matrix_b):
+        return None
+
+    columns = len(matrix_b[0])
+    result = []
+    for row_a in matrix_a:
+        row = [0.0] * columns
+        for a_ik, row_b in zip(row_a, matrix_b):
+            for j in range(columns):
+                row[j] += a_ik * row_b[j]
+        result.append(row)
+
+    return result
+
+
+def calculate_matrix_sum(
+    matrix_a: Matrix, matrix_b: Matrix
+) -> Optional[List[List[float]]]:
+    """
+    Add two matrices
+
+    Parameters:
+        matrix_a (Matrix): First matrix
+        matrix_b (Matrix): Second matrix
+
     Returns:
         Optional[List[List[float]]]: Sum of matrix a and matrix b
     """
-    if not matrix_a or not matrix_b:
+    a = _as_matrix(matrix_a)
+    b = _as_matrix(matrix_b)
+    if a is None or b is None:
         return None
 
-    if len(matrix_a) != len(matrix_b) or len(matrix_a[0]) != len(matrix_b[0]):
+    if a.shape != b.shape:
         return None
 
-    return [
-        [float(matrix_a[i][j] + matrix_b[i][j]) for j in range(len(matrix_a[0]))]
-        for i in range(len(matrix_a))
-    ]
+    return (a + b).tolist()
 
 
 def calculate_matrix_product(
-    matrix_a: List[List[float]], matrix_b: List[List[float]]
+    matrix_a: Matrix, matrix_b: Matrix
 ) -> Optional[List[List[float]]]:
     """
     Multiplicate two matrices
 
+    Products of at most SMALL_PRODUCT_LIMIT scalar multiplications given as lists
+    are computed directly. Larger ones are delegated to NumPy, which runs them
+    through BLAS; it already blocks the computation for the cache.
+
     Parameters:
-        matrix_a (List[List[float]]): First matrix
-        matrix_b (List[List[float]]): Second matrix
+        matrix_a (Matrix): First matrix
+        matrix_b (Matrix): Second matrix
 
     Returns:
         Optional[List[List[float]]]: Product of matrix a and matrix b
     """
-    if not matrix_a or not matrix_b:
+    if (
+        isinstance(matrix_a, list)
+        and isinstance(matrix_b, list)
+        and matrix_a
+        and matrix_b
+        and matrix_b[0]
+        and len(matrix_a) * len(matrix_b) * len(matrix_b[0]) <= SMALL_PRODUCT_LIMIT
+    ):
+        return _small_product(matrix_a, matrix_b)
+
+    a = _as_matrix(matrix_a)
+    b = _as_matrix(matrix_b)
+    if a is None or b is None:
         return None
 
-    if len(matrix_a[0]) != len(matrix_b):
+    if a.shape[1] != b.shape[0]:
         return None
 
-    result = [[0.0 for _ in range(len(matrix_b[0]))] for _ in range(len(matrix_a))]
-    for i in range(len(matrix_a)):
-        for j in range(len(matrix_b[0])):
-            for k in range(len(matrix_b)):
-                result[i][j] += float(matrix_a[i][k] * matrix_b[k][j])
-
-    return result
+    return (a @ b).tolist()
 
 
 def calculate_matrix_transpose(
-    matrix: List[List[float]],
+    matrix: Matrix,
 ) -> Optional[List[List[float]]]:
     """
      Transpose a matrix
 
+    Lists are transposed with zip(*matrix), which moves the elements in C
+    without converting the matrix to an array and back.
+
     Parameters:
-        matrix (List[List[float]]): Matrix
+        matrix (Matrix): Matrix
 
     Returns:
         Optional[List[List[float]]]: Transposed matrix
     """
-    if not matrix:
+    if isinstance(matrix, list):
+        if not matrix or not matrix[0]:
+            return None
+
+        return [[*map(float, column)] for column in zip(*matrix)]
+
+    array = _as_matrix(matrix)
+    if array is None:
         return None
 
-    return [
-        [float(matrix[j][i]) for j in range(len(matrix))] for i in range(len(matrix[0]))
-    ]
+    return array.T.tolist()
@@ -2,88 +2,170 @@
 Vector Operations Module
 
 This module provides basic vector operations including:
-- Scalar (dot) product calculation
+- Scalar (dot) product calculation, also for sparse vectors
 - Vector length calculation
 - Angle between vectors calculation
 
-All functions work with vectors represented as lists of floats.
+Functions accept vectors as lists of floats or NumPy arrays. Long vectors are
+processed with NumPy, short lists stay in plain Python where converting them to
+arrays would cost more than the arithmetic.
 """
 
-from math import sqrt, acos
-from typing import List, Optional
+from math import acos, hypot, isfinite
+from typing import List, Optional, Union
 
+import numpy as np
 
-def calculate_scalar_product(
-    vector1: List[float], vector2: List[float]
-) -> Optional[float]:
+SMALL_VECTOR_LIMIT = 64
+SAFE_LENGTH_RANGE = (1e-150, 1e150)
+
+Vector = Union[List[float], np.ndarray]
+Indices = Union[List[int], np.ndarray]
+
+
+def _is_small(*vectors: Vector) -> bool:
+    """
+    Check whether all vectors are short lists best handled without NumPy
+
+    Parameters:
+        *vectors (Vector): Vectors to check
+
+    Returns:
+        bool: True if every vector is a list of at most SMALL_VECTOR_LIMIT items
+    """
+    return all(
+        isinstance(vector, list) and len(vector) <= SMALL_VECTOR_LIMIT
+        for vector in vectors
+    )
+
+
+def calculate_scalar_product(vector1: Vector, vector2: Vector) -> Optional[float]:
     """
     Calculate scalar product of two vectors
 
     Parameters:
-        vector1 (List[float]): First vector
-        vector2 (List[float]): Second vector
+        vector1 (Vector): First vector
+        vector2 (Vector): Second vector
 
     Returns:
         Optional[float]: Scalar product of vectors vector1 and vector2
     """
-    if len(vector1) != len(vector2):
+    if len(vector1) != len(vector2) or len(vector1) == 0:
         return None
 
-    if not vector1 or not vector2:
+    if _is_small(vector1, vector2):
+        return sum(x * y for x, y in zip(vector1, vector2))
+
+    a = np.asarray(vector1, dtype=np.float64)
+    b = np.asarray(vector2, dtype=np.float64)
+    if a.shape != b.shape:
         return None
 
-    return sum(vector1[i] * vector2[i] for i in range(len(vector1)))
+    return float(a @ b)
 
 
-def calculate_vector_length(vector: List[float]) -> float:
+def calculate_scalar_product_sparse(
+    indices1: Indices, values1: Vector, indices2: Indices, values2: Vector
+) -> Optional[float]:
+    """
+    Calculate scalar product of two sparse vectors
+
+    Each vector is given by the positions of its nonzero elements and their
+    values, so the work depends on the number of nonzeros instead of the full
+    length. Use calculate_scalar_product for dense vectors.
+
+    Parameters:
+        indices1 (Indices): Unique positions of nonzero elements of the first vector
+        values1 (Vector): Values of the first vector at indices1
+        indices2 (Indices): Unique positions of nonzero elements of the second vector
+        values2 (Vector): Values of the second vector at indices2
+
+    Returns:
+        Optional[float]: Scalar product of the vectors, None if some indices and
+            values differ in length
+    """
+    if len(indices1) != len(values1) or len(indices2) != len(values2):
+        return None
+
+    _, positions1, positions2 = np.intersect1d(
+        indices1, indices2, assume_unique=True, return_indices=True
+    )
+    a = np.asarray(values1, dtype=np.float64)[positions1]
+    b = np.asarray(values2, dtype=np.float64)[positions2]
+    return float(a @ b)
+
+
+def calculate_vector_length(vector: Vector) -> float:
     """
     Calculate length of a vector
 
+    Short lists go through math.hypot, which scales the elements internally, so
+    it neither overflows nor loses precision on very large or small values.
+    Longer vectors use np.linalg.norm, and are divided by their largest
+    magnitude first when the sum of squares could leave the float range.
+
     Parameters:
-        vector (List[float]): Input vector
+        vector (Vector): Input vector
 
     Returns:
         float: Length of vector
     """
-    if not vector:
+    if len(vector) == 0:
         return 0.0
 
-    return sqrt(sum(x**2 for x in vector))
+    if _is_small(vector):
+        return hypot(*vector)
+
+    array = np.asarray(vector, dtype=np.float64)
+    with np.errstate(over="ignore", under="ignore"):
+        length = float(np.linalg.norm(array))
+    if SAFE_LENGTH_RANGE[0] < length < SAFE_LENGTH_RANGE[1]:
+        return length
+
+    scale = float(np.max(np.abs(array)))
+    if scale == 0 or not isfinite(scale):
+        return scale
+
+    return scale * float(np.linalg.norm(array / scale))
 
 
 def calculate_angle_between_vectors(
-    vector1: List[float], vector2: List[float]
+    vector1: Vector, vector2: Vector
 ) -> Optional[float]:
     """
     Calculate angle between two vectors
 
+    Lengths come from calculate_vector_length and the scalar product is taken
+    of the vectors scaled to unit length, so large or small components neither
+    overflow nor underflow. Rounding errors can push the cosine slightly outside
+    [-1, 1] for (anti)parallel vectors, so it is clamped before taking acos.
+
     Parameters:
-        vector1 (List[float]): First vector
-        vector2 (List[float]): Second vector
+        vector1 (Vector): First vector
+        vector2 (Vector): Second vector
 
     Returns:
-        Optional[float]: Angle between vectors in radians
+        Optional[float]: Angle between vectors in radians, None if a vector is
+            zero or has non-finite components
     """
-
-    if len(vector1) != len(vector2):
-        return None
-
-    scalar_result = calculate_scalar_product(vector1, vector2)
-    if scalar_result is None:
+    if len(vector1) != len(vector2) or len(vector1) == 0:
         return None
 
     length1 = calculate_vector_length(vector1)
     length2 = calculate_vector_length(vector2)
-
     if length1 == 0 or length2 == 0:
         return None
 
-    denominator = length1 * length2
-    if denominator == 0:
-        return None
+    if _is_small(vector1, vector2):
+        cos_angle = sum((x / length1) * (y / length2) for x, y in zip(vector1, vector2))
+    else:
+        a = np.asarray(vector1, dtype=np.float64)
+        b = np.asarray(vector2, dtype=np.float64)
+        if a.shape != b.shape:
+            return None
+        cos_angle = float((a / length1) @ (b / length2))
 
-    cos_angle = scalar_result / denominator
-    if cos_angle < -1 or cos_angle > 1:
+    if not isfinite(cos_angle):
         return None
 
-    return acos(cos_angle)
+    return acos(min(1.0, max(-1.0, cos_angle)))
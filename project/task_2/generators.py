@@ -13,9 +13,15 @@ All operations are applied lazily, processing data on-demand without loading
 entire datasets into memory.
 """
 
-from typing import Callable, Generator, Any, Iterable, Iterator, Union
+from typing import Callable, Generator, Any, Iterable, Iterator, Tuple, Union
 from functools import reduce
 
+import numpy as np
+
+Operation = Callable[[Iterator[Any]], Iterator[Any]]
+
+_NO_INITIAL = object()
+
 
 def create_data_stream(data_source: Iterable[Any]) -> Generator[Any, None, None]:
     """
@@ -30,9 +36,28 @@ def create_data_stream(data_source: Iterable[Any]) -> Generator[Any, None, None]
     yield from data_source
 
 
-def create_operation_adapter(
-    func: Callable, *args: Any, **kwargs: Any
-) -> Callable[[Generator[Any, None, None]], Generator[Any, None, None]]:
+class _ElementwiseOperation:
+    """
+    Adapted map or filter operation.
+
+    Calling it returns the builtin map/filter iterator itself, without a
+    generator frame around it. The builtin and the user function are exposed
+    as well, so apply_processing_pipeline can chain the iterators directly.
+
+    Attributes:
+        builtin (Callable): Either map or filter
+        function (Callable): Transformation or predicate applied to every element
+    """
+
+    def __init__(self, builtin: Callable, function: Callable) -> None:
+        self.builtin = builtin
+        self.function = function
+
+    def __call__(self, input_generator: Iterator[Any]) -> Iterator[Any]:
+        return self.builtin(self.function, input_generator)
+
+
+def create_operation_adapter(func: Callable, *args: Any, **kwargs: Any) -> Operation:
     """
     Create an adapter for any function to work with the processing pipeline.
 
@@ -42,51 +67,101 @@ def create_operation_adapter(
         **kwargs: Keyword arguments for the function
 
     Returns:
-        Callable[[Generator[Any, None, None]], Generator[Any, None, None]]:
-        Adapted function that takes a generator and returns a generator
+        Operation: Adapted function that takes an iterator and returns an iterator
     """
 
+    if func is map or func is filter:
+        return _ElementwiseOperation(func, args[0])
+
+    if func is zip:
+
+        def apply_zipping(input_generator: Iterator[Any]) -> Iterator[Any]:
+            return zip(input_generator, *args)
+
+        return apply_zipping
+
     def apply_adapted_operation(
-        input_generator: Generator[Any, None, None]
+        input_generator: Iterator[Any],
     ) -> Generator[Any, None, None]:
-        if func is map:
-            yield from map(args[0], input_generator)
-        elif func is filter:
-            yield from filter(args[0], input_generator)
-        elif func is zip:
-            yield from zip(input_generator, *args)
-        elif func is enumerate:
+        if func is enumerate:
             yield from enumerate(input_generator, *args, **kwargs)
         elif func is reduce:
             reduction_func = args[0] if args else func
-            initial = args[1] if len(args) > 1 else kwargs.get("initializer", None)
+            initial = (
+                args[1] if len(args) > 1 else kwargs.get("initializer", _NO_INITIAL)
+            )
 
-            if initial is not None:
-                result = reduce(reduction_func, input_generator, initial)
+            if initial is _NO_INITIAL:
+                yield reduce(reduction_func, input_generator)
             else:
-                result = reduce(reduction_func, input_generator)
-            yield result
+                yield reduce(reduction_func, input_generator, initial)
         else:
             yield from func(input_generator, *args, **kwargs)
 
     return apply_adapted_operation
 
 
+def _apply_numpy_operations(
+    array: np.ndarray, operations: Tuple[Operation, ...]
+) -> Tuple[np.ndarray, Tuple[Operation, ...]]:
+    """
+    Eagerly apply the leading map/filter stages whose function is a NumPy ufunc.
+
+    Only one-dimensional arrays and single-output ufuncs take this path: a
+    lazy pipeline yields rows of a multi-dimensional array and tuples from a
+    multi-output ufunc, which whole-array evaluation would not reproduce.
+
+    Parameters:
+        array (np.ndarray): Source array
+        operations (Tuple[Operation, ...]): Pipeline operations
+
+    Returns:
+        Tuple[np.ndarray, Tuple[Operation, ...]]: Resulting array and the operations
+            that still have to be applied lazily
+    """
+    if array.ndim != 1:
+        return array, operations
+    for index, operation in enumerate(operations):
+        if not (
+            isinstance(operation, _ElementwiseOperation)
+            and isinstance(operation.function, np.ufunc)
+            and operation.function.nout == 1
+        ):
+            return array, operations[index:]
+        if operation.builtin is map:
+            array = operation.function(array)
+        else:
+            array = array[operation.function(array).astype(bool)]
+    return array, ()
+
+
 def apply_processing_pipeline(
-    input_generator: Generator[Any, None, None],
-    *operations: Callable[[Generator[Any, None, None]], Generator[Any, None, None]]
-) -> Generator[Any, None, None]:
+    input_generator: Union[Iterator[Any], np.ndarray], *operations: Operation
+) -> Iterator[Any]:
     """
     Apply a sequence of processing operations to a data stream in a lazy manner.
 
+    Map and filter stages are chained as builtin map/filter iterators, so a run
+    of them is driven entirely by C code without a generator frame per stage.
+    If the source is a NumPy array, leading map/filter stages with a ufunc are
+    evaluated on the whole array at once, and the rest of the pipeline iterates
+    over the result.
+
     Parameters:
-        input_generator (Generator[Any, None, None]): Source data generator
-        *operations (Callable): Sequence of operations to apply to the data stream
+        input_generator (Union[Iterator[Any], np.ndarray]): Source data generator
+            or one-dimensional array
+        *operations (Operation): Sequence of operations to apply to the data stream
 
     Returns:
-        Generator[Any, None, None]: Resulting generator after applying all operations
+        Iterator[Any]: Resulting iterator after applying all operations
     """
-    current_stream = input_generator
+    current_stream: Iterator[Any]
+    if isinstance(input_generator, np.ndarray):
+        array, operations = _apply_numpy_operations(input_generator, operations)
+        current_stream = iter(array)
+    else:
+        current_stream = input_generator
+
     for operation in operations:
         current_stream = operation(current_stream)
 
@@ -1,4 +1,3 @@
-from collections import OrderedDict
 from typing import Any, Callable
 import functools
 
@@ -8,6 +7,10 @@ def decorator_cache(size: int = 0):
     Caching decorator that stores up to `size` most recent function call results.
     Disabled when `size` is 0 (default).
 
+    Caching is delegated to `functools.lru_cache`, whose C implementation
+    handles key building, lookup and LRU eviction. Keyword arguments are
+    sorted by name first, so their order does not create separate entries.
+
     Args:
         size (int): Maximum number of cached results. Must be >= 0.
 
@@ -26,23 +29,13 @@ def decorator_cache(size: int = 0):
         if size == 0:
             return func
 
-        cache: OrderedDict = OrderedDict()
+        cached = functools.lru_cache(maxsize=size)(func)
 
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            key = (args, tuple(sorted(kwargs.items())))
-
-            if key in cache:
-                cache.move_to_end(key)
-                return cache[key]
-
-            result = func(*args, **kwargs)
-            cache[key] = result
-
-            if len(cache) > size:
-                cache.popitem(last=False)
-
-            return result
+            if len(kwargs) > 1:
+                kwargs = dict(sorted(kwargs.items()))
+            return cached(*args, **kwargs)
 
         return wrapper
 
@@ -1,4 +1,81 @@
-from typing import Callable, Any
+from typing import Callable, Any, Dict, List, Optional
+
+# Functions of higher arity are curried without generated code, because
+# the Python tokenizer limits how deeply nested definitions can be indented
+MAX_GENERATED_ARITY = 32
+
+_CURRY_FACTORIES: Dict[int, Callable[[Callable], Callable]] = {}
+_UNCURRY_FACTORIES: Dict[int, Callable[[Callable], Callable]] = {}
+
+
+def _build_factory(lines: List[str]) -> Callable[[Callable], Callable]:
+    """
+    Compile the source of a function named `factory` and return it.
+
+    Parameters:
+        lines (List[str]): Source lines defining `factory`
+
+    Returns:
+        Callable[[Callable], Callable]: The compiled factory
+    """
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["factory"]
+
+
+def _curry_factory(arity: int) -> Callable[[Callable], Callable]:
+    """
+    Get a function that curries its argument with the given arity.
+
+    The factory is a chain of nested one-argument functions generated once
+    per arity, so applying an argument is a plain closure call and the last
+    step calls the original function with all arguments directly.
+
+    Parameters:
+        arity (int): Number of arguments, from 1 to MAX_GENERATED_ARITY
+
+    Returns:
+        Callable[[Callable], Callable]: Factory taking the function to curry
+    """
+    factory = _CURRY_FACTORIES.get(arity)
+    if factory is None:
+        names = [f"arg{i}" for i in range(arity)]
+        lines = ["def factory(func):"]
+        for depth, name in enumerate(names, 1):
+            lines.append(" " * depth + f"def step{depth}({name}):")
+        lines.append(" " * (arity + 1) + f"return func({', '.join(names)})")
+        for depth in range(arity, 0, -1):
+            lines.append(" " * depth + f"return step{depth}")
+        factory = _CURRY_FACTORIES[arity] = _build_factory(lines)
+    return factory
+
+
+def _uncurry_factory(arity: int) -> Callable[[Callable], Callable]:
+    """
+    Get a function that uncurries its argument with the given arity.
+
+    The factory is generated once per arity and applies the arguments with
+    a single unrolled chain of calls instead of a loop.
+
+    Parameters:
+        arity (int): Number of arguments, from 0 to MAX_GENERATED_ARITY
+
+    Returns:
+        Callable[[Callable], Callable]: Factory taking the curried function
+    """
+    factory = _UNCURRY_FACTORIES.get(arity)
+    if factory is None:
+        calls = "".join(f"(args[{i}])" for i in range(arity))
+        lines = [
+            "def factory(func):",
+            " def uncurried(*args):",
+            f"  if len(args) != {arity}:",
+            "   raise ValueError('Arity not eq with args')",
+            f"  return func{calls}",
+            " return uncurried",
+        ]
+        factory = _UNCURRY_FACTORIES[arity] = _build_factory(lines)
+    return factory
 
 
 def curry_explicit(func: Callable, arity: int) -> Callable:
@@ -32,17 +109,25 @@ def curry_explicit(func: Callable, arity: int) -> Callable:
 
         return zero_arity
 
-    def curried_function(accumulated_args: tuple = ()) -> Callable:
-        if len(accumulated_args) == arity:
-            return func(*accumulated_args)
+    if arity <= MAX_GENERATED_ARITY:
+        return _curry_factory(arity)(func)
 
+    def curried_function(previous: Optional[tuple], collected: int) -> Callable:
+        # Arguments are kept as a linked list of (previous, arg) nodes, so every
+        # step is O(1) and partially applied functions can be safely reused.
         def next_curried(next_arg: Any) -> Any:
-            new_args = accumulated_args + (next_arg,)
-            return curried_function(new_args)
+            node: Any = (previous, next_arg)
+            if collected + 1 < arity:
+                return curried_function(node, collected + 1)
+
+            args = [None] * arity
+            for i in range(arity - 1, -1, -1):
+                node, args[i] = node
+            return func(*args)
 
         return next_curried
 
-    return curried_function()
+    return curried_function(None, 0)
 
 
 def uncurry_explicit(func: Callable, arity: int) -> Callable:
@@ -68,6 +153,9 @@ def uncurry_explicit(func: Callable, arity: int) -> Callable:
     if arity < 0:
         raise ValueError("Arity must be non-negative")
 
+    if arity <= MAX_GENERATED_ARITY:
+        return _uncurry_factory(arity)(func)
+
     def uncurried(*args: Any) -> Any:
         if len(args) != arity:
             raise ValueError("Arity not eq with args")
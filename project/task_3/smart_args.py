@@ -3,6 +3,26 @@ import inspect
 from typing import Callable, Any
 
 
+class _Isolated:
+    """Marker type of `isolated()` defaults."""
+
+    __slots__ = ()
+    name = "isolated"
+
+
+class _Evaluated:
+    """Marker type of `evaluated(func)` defaults."""
+
+    __slots__ = ("func",)
+    name = "evaluated"
+
+    def __init__(self, func: Callable) -> None:
+        self.func = func
+
+
+_ISOLATED = _Isolated()
+
+
 def smart_args(enable_positional: bool = False):
     """
     Decorator that enhances default arguments with `isolated()` and `evaluated()` markers.
@@ -22,49 +42,39 @@ def smart_args(enable_positional: bool = False):
     def decorator(func: Callable) -> Callable:
         sig = inspect.signature(func)
 
-        if not enable_positional:
-            for name, param in sig.parameters.items():
-                default = param.default
-                if isinstance(default, tuple) and default[0] in (
-                    "isolated",
-                    "evaluated",
-                ):
-                    if param.kind != param.KEYWORD_ONLY:
-                        raise AssertionError(
-                            f"Cannot use {default[0]} for positional arguments"
-                        )
+        markers = []
+        for name, param in sig.parameters.items():
+            default = param.default
+            marker_type = type(default)
+            if marker_type is not _Isolated and marker_type is not _Evaluated:
+                continue
+
+            if not enable_positional and param.kind != param.KEYWORD_ONLY:
+                raise AssertionError(
+                    f"Cannot use {default.name} for positional arguments"
+                )
+            markers.append((name, default))
+
+        if not markers:
+            return func
 
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             bound_args = sig.bind(*args, **kwargs)
             bound_args.apply_defaults()
             arguments_dict = dict(bound_args.arguments)
 
-            for name, param in sig.parameters.items():
-                default = param.default
+            for name, default in markers:
                 current_value = arguments_dict[name]
 
-                is_isolated = isinstance(default, tuple) and default == ("isolated",)
-                is_evaluated = (
-                    isinstance(default, tuple)
-                    and len(default) == 2
-                    and default[0] == "evaluated"
-                )
-
-                if is_isolated and is_evaluated:
-                    raise AssertionError(
-                        f"Argument '{name}' cannot be both Isolated and Evaluated"
-                    )
-
-                if is_isolated:
-                    if current_value == default:
+                if default is _ISOLATED:
+                    if current_value is _ISOLATED:
                         raise ValueError(
                             f"Argument '{name}' with Isolated() must be provided"
                         )
                     arguments_dict[name] = copy.deepcopy(current_value)
 
-                elif is_evaluated:
-                    if current_value == default:
-                        arguments_dict[name] = default[1]()
+                elif current_value is default:
+                    arguments_dict[name] = default.func()
 
             return func(**arguments_dict)
 
@@ -73,11 +83,11 @@ def smart_args(enable_positional: bool = False):
     return decorator
 
 
-def evaluated(func: Callable) -> tuple:
+def evaluated(func: Callable) -> _Evaluated:
     """Marks a default argument to be evaluated at call time via `func()`."""
-    return ("evaluated", func)
+    return _Evaluated(func)
 
 
-def isolated() -> tuple:
+def isolated() -> _Isolated:
     """Marks a required argument that will be deep-copied on use."""
-    return ("isolated",)
+    return _ISOLATED
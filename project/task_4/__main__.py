@@ -0,0 +1,4 @@
+from project.task_4.game import main
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,21 @@
-import random
-from typing import List
+from array import array
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
 from project.task_4.enums import Suit, Rank
 
+RANK_VALUE = {
+    rank: (
+        11
+        if rank is Rank.ACE
+        else 10
+        if rank in (Rank.JACK, Rank.QUEEN, Rank.KING)
+        else int(rank.value)
+    )
+    for rank in Rank
+}
+
 
 class Card:
     """
@@ -10,8 +24,12 @@ class Card:
     Attributes:
         suit (Suit): The suit of the card
         rank (Rank): The rank of the card
+        _name (str): String representation, built once per card
+        _value (int): Blackjack value of the card
     """
 
+    __slots__ = ("suit", "rank", "_name", "_value")
+
     def __init__(self, suit: Suit, rank: Rank) -> None:
         """
         Initialize a card with suit and rank
@@ -22,6 +40,8 @@ class Card:
         """
         self.suit = suit
         self.rank = rank
+        self._name = f"{rank.value} of {suit.value}"
+        self._value = RANK_VALUE[rank]
 
     def __str__(self) -> str:
         """
@@ -30,7 +50,7 @@ class Card:
         Returns:
             str: String representation in format 'Rank of Suit'
         """
-        return f"{self.rank.value} of {self.suit.value}"
+        return self._name
 
     def get_value(self) -> int:
         """
@@ -39,12 +59,7 @@ class Card:
         Returns:
             int: Value of the card (2-10, 10 for face cards, 11 for Ace)
         """
-        if self.rank in [Rank.JACK, Rank.QUEEN, Rank.KING]:
-            return 10
-        elif self.rank == Rank.ACE:
-            return 11
-        else:
-            return int(self.rank.value)
+        return self._value
 
     def is_same_rank(self, other_card: "Card") -> bool:
         """
@@ -56,21 +71,86 @@ class Card:
         Returns:
             bool: True if cards have same rank, False otherwise
         """
-        return self.rank == other_card.rank
+        return self.rank is other_card.rank
+
+    @staticmethod
+    def from_code(code: int) -> "Card":
+        """
+        Get the card with the given code
+
+        Codes are suit_index * 13 + rank_index, following the declaration order of
+        Suit and Rank. Cards are shared, one instance per code.
+
+        Parameters:
+            code (int): Card code in range [0, 52)
+
+        Returns:
+            Card: The card with this code
+        """
+        return _CARDS[code]
+
+
+_CARDS = tuple(Card(suit, rank) for suit in Suit for rank in Rank)
 
 
 class Deck:
     """
     Represents a deck of 52 playing cards
 
+    Cards are dealt from the end of a fixed buffer of card codes by moving
+    an index, and reshuffling reuses the same buffer. The buffer is shuffled
+    in place by NumPy through an array view of the same memory.
+
     Attributes:
-        cards (List[Card]): List of cards in the deck
+        _codes (array): Codes of all 52 cards, one byte per card
+        _view (np.ndarray): NumPy view of _codes
+        _rng (np.random.Generator): Random generator used for shuffling
+        _top (int): Number of cards not dealt yet
     """
 
-    def __init__(self) -> None:
-        """Initialize a new shuffled deck of 52 cards"""
-        self.cards = [Card(suit, rank) for suit in Suit for rank in Rank]
-        random.shuffle(self.cards)
+    __slots__ = ("_codes", "_view", "_rng", "_top")
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Initialize a new shuffled deck of 52 cards
+
+        Parameters:
+            seed (Optional[int]): Seed for the shuffling generator, random if None
+        """
+        self._codes = array("B", range(len(_CARDS)))
+        self._view = np.frombuffer(self._codes, dtype=np.uint8)
+        self._rng = np.random.default_rng(seed)
+        self.reshuffle()
+
+    @property
+    def cards(self) -> Tuple[Card, ...]:
+        """
+        Get the cards left in the deck
+
+        The deck used to expose a mutable list here. Cards are now stored as
+        codes, so a read-only snapshot is returned and attempts to change it
+        fail instead of silently leaving the deck as it was. Use deal_card,
+        deal_cards and reshuffle to change the deck.
+
+        Returns:
+            Tuple[Card, ...]: Cards in the deck, the next card to be dealt is the last one
+        """
+        return tuple(_CARDS[code] for code in self._codes[: self._top])
+
+    @property
+    def codes(self) -> array:
+        """
+        Get codes of the cards left in the deck, without building Card lists
+
+        Returns:
+            array: Card codes, the next card to be dealt is the last one
+        """
+        return self._codes[: self._top]
+
+    def reshuffle(self) -> None:
+        """Return all dealt cards to the deck and shuffle it"""
+        self._rng.shuffle(self._view)
+        self._top = len(self._codes)
 
     def deal_card(self) -> Card:
         """
@@ -78,8 +158,34 @@ class Deck:
 
         Returns:
             Card: The top card from the deck
+
+        Raises:
+            IndexError: If the deck is empty
+        """
+        if self._top == 0:
+            raise IndexError("deal from empty deck")
+        self._top -= 1
+        return _CARDS[self._codes[self._top]]
+
+    def deal_cards(self, count: int) -> List[Card]:
+        """
+        Deal several cards from the deck at once
+
+        Parameters:
+            count (int): Number of cards to deal
+
+        Returns:
+            List[Card]: Dealt cards, in the order deal_card would return them
+
+        Raises:
+            IndexError: If the deck has fewer than count cards
         """
-        return self.cards.pop()
+        start = self._top - count
+        if start < 0:
+            raise IndexError("not enough cards in deck")
+        codes = self._codes[start : self._top]
+        self._top = start
+        return [_CARDS[code] for code in reversed(codes)]
 
     def cards_remaining(self) -> int:
         """
@@ -88,7 +194,7 @@ class Deck:
         Returns:
             int: Number of cards left in the deck
         """
-        return len(self.cards)
+        return self._top
 
 
 class Hand:
@@ -97,11 +203,17 @@ class Hand:
 
     Attributes:
         cards (List[Card]): List of cards in the hand
+        _score (int): Current score of the hand
+        _aces (int): Number of Aces still counted as 11 in the score
     """
 
+    __slots__ = ("cards", "_score", "_aces")
+
     def __init__(self) -> None:
         """Initialize an empty hand"""
         self.cards: List[Card] = []
+        self._score = 0
+        self._aces = 0
 
     def add_card(self, card: Card) -> None:
         """
@@ -111,6 +223,33 @@ class Hand:
             card (Card): Card to add to the hand
         """
         self.cards.append(card)
+        value = card._value
+        self._score += value
+        if value == 11:
+            self._aces += 1
+
+        while self._score > 21 and self._aces > 0:
+            self._score -= 10
+            self._aces -= 1
+
+    def add_cards(self, cards: Iterable[Card]) -> None:
+        """
+        Add several cards to the hand, adjusting Aces once at the end
+
+        Parameters:
+            cards (Iterable[Card]): Cards to add to the hand
+        """
+        start = len(self.cards)
+        self.cards.extend(cards)
+        for card in self.cards[start:]:
+            value = card._value
+            self._score += value
+            if value == 11:
+                self._aces += 1
+
+        while self._score > 21 and self._aces > 0:
+            self._score -= 10
+            self._aces -= 1
 
     def get_score(self) -> int:
         """
@@ -119,23 +258,7 @@ class Hand:
         Returns:
             int: Total score with Aces adjusted to prevent busting
         """
-        score = 0
-        aces = 0
-
-        for card in self.cards:
-            if card.rank == Rank.ACE:
-                aces += 1
-                score += 11
-            elif card.rank in [Rank.JACK, Rank.QUEEN, Rank.KING]:
-                score += 10
-            else:
-                score += int(card.rank.value)
-
-        while score > 21 and aces > 0:
-            score -= 10
-            aces -= 1
-
-        return score
+        return self._score
 
     def is_blackjack(self) -> bool:
         """
@@ -144,7 +267,7 @@ class Hand:
         Returns:
             bool: True if hand is Blackjack, False otherwise
         """
-        return len(self.cards) == 2 and self.get_score() == 21
+        return len(self.cards) == 2 and self._score == 21
 
     def is_busted(self) -> bool:
         """
@@ -153,7 +276,7 @@ class Hand:
         Returns:
             bool: True if hand is busted, False otherwise
         """
-        return self.get_score() > 21
+        return self._score > 21
 
     def can_split(self) -> bool:
         """
@@ -162,7 +285,8 @@ class Hand:
         Returns:
             bool: True if hand can be split, False otherwise
         """
-        return len(self.cards) == 2 and self.cards[0].is_same_rank(self.cards[1])
+        cards = self.cards
+        return len(cards) == 2 and cards[0].rank is cards[1].rank
 
     def is_five_card_charlie(self) -> bool:
         """
@@ -171,8 +295,10 @@ class Hand:
         Returns:
             bool: True if Five Card Charlie, False otherwise
         """
-        return len(self.cards) >= 5 and not self.is_busted()
+        return len(self.cards) >= 5 and self._score <= 21
 
     def clear(self) -> None:
         """Clear all cards from the hand"""
         self.cards.clear()
+        self._score = 0
+        self._aces = 0
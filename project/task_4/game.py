@@ -1,7 +1,15 @@
-from typing import List
+import io
+from multiprocessing import Pool
+from typing import Dict, List, Optional, Sequence, Tuple
 from project.task_4.core import Deck, Hand, Card
 from project.task_4.players import PlayerBase, Player, Bot
 from project.task_4.enums import Rank, StrategyType
+from project.task_4.simulation import simulate_rounds
+from project.task_4.strategies import (
+    RiskTakerStrategy,
+    SafePlayerStrategy,
+    seed_strategies,
+)
 
 
 class Game:
@@ -16,26 +24,155 @@ class Game:
         current_round (int): Current round number
         max_rounds (int): Maximum number of rounds
         game_over (bool): Whether game has ended
+        verbose (bool): Whether game messages are shown
+        _log (io.StringIO): Messages not written to the console yet
+        _groups (Optional[Tuple[Tuple[PlayerBase, ...], ...]]): Cached
+            participants, everyone and seats, None when they must be rebuilt
+        _group_sizes (Tuple[int, int]): Numbers of players and bots the cached
+            groups were built from
     """
 
-    def __init__(self, max_rounds: int = 5) -> None:
+    def __init__(
+        self, max_rounds: int = 5, verbose: bool = True, seed: Optional[int] = None
+    ) -> None:
         """
         Initialize a new Blackjack game
 
         Parameters:
             max_rounds (int): Maximum number of rounds to play
+            verbose (bool): Whether to show game messages
+            seed (Optional[int]): Seed for shuffling the deck, random if None
         """
-        self.deck: Deck = Deck()
-        self.bots: List[Bot] = [
-            Bot("Safe Bot", StrategyType.SAFE),
-            Bot("Risk Taker Bot", StrategyType.RISK_TAKER),
-            Bot("Unpredictable Bot", StrategyType.UNPREDICTABLE),
+        self.deck: Deck = Deck(seed)
+        self._groups: Optional[Tuple[Tuple[PlayerBase, ...], ...]] = None
+        self._group_sizes = (0, 0)
+        self.bots = [
+            Bot("Safe Bot", StrategyType.SAFE, verbose),
+            Bot("Risk Taker Bot", StrategyType.RISK_TAKER, verbose),
+            Bot("Unpredictable Bot", StrategyType.UNPREDICTABLE, verbose),
         ]
         self.dealer: Bot = Bot("Dealer")
-        self.players: List[Player] = []
+        self.players = []
         self.current_round: int = 0
         self.max_rounds: int = max_rounds
         self.game_over: bool = False
+        self.verbose: bool = verbose
+        self._log = io.StringIO()
+
+    @property
+    def players(self) -> List[Player]:
+        """Human players"""
+        return self._players
+
+    @players.setter
+    def players(self, players: List[Player]) -> None:
+        self._players = players
+        self._groups = None
+
+    @property
+    def bots(self) -> List[Bot]:
+        """AI players"""
+        return self._bots
+
+    @bots.setter
+    def bots(self, bots: List[Bot]) -> None:
+        self._bots = bots
+        self._groups = None
+
+    def _get_groups(self) -> Tuple[Tuple[PlayerBase, ...], ...]:
+        """
+        Get the cached participant groups, rebuilding them if membership changed
+
+        The groups are rebuilt after players or bots is reassigned, and after
+        an in-place append or removal changes the length of either list.
+        Replacing a list item in place requires reassigning the list.
+
+        Returns:
+            Tuple[Tuple[PlayerBase, ...], ...]: Participants, everyone and seats
+        """
+        sizes = (len(self._players), len(self._bots))
+        if self._groups is None or sizes != self._group_sizes:
+            participants = (*self._players, *self._bots)
+            self._groups = (
+                participants,
+                (*participants, self.dealer),
+                (*self._bots, *self._players, self.dealer),
+            )
+            self._group_sizes = sizes
+        return self._groups
+
+    @property
+    def _participants(self) -> Tuple[PlayerBase, ...]:
+        """Players followed by bots"""
+        return self._get_groups()[0]
+
+    @property
+    def _everyone(self) -> Tuple[PlayerBase, ...]:
+        """Participants followed by the dealer"""
+        return self._get_groups()[1]
+
+    @property
+    def _seats(self) -> Tuple[PlayerBase, ...]:
+        """Bots, players and the dealer in dealing order"""
+        return self._get_groups()[2]
+
+    def _say(self, message: str) -> None:
+        """
+        Queue a game message for the console
+
+        Messages are collected in a buffer and written at once by _flush, so
+        a round costs a few console writes instead of one per message. Messages
+        inside the round loop are only formatted when verbose is set.
+
+        Parameters:
+            message (str): Message to show
+        """
+        if self.verbose:
+            self._log.write(message)
+            self._log.write("\n")
+
+    def _flush(self) -> None:
+        """Write queued game messages to the console"""
+        if self._log.tell():
+            print(self._log.getvalue(), end="")
+            self._log.seek(0)
+            self._log.truncate()
+
+    @staticmethod
+    def simulate_many(
+        n_rounds: int,
+        seed: Optional[int] = None,
+        hit_tables: Optional[Dict[str, Sequence[bool]]] = None,
+    ) -> Dict[str, Tuple[int, int, int]]:
+        """
+        Play many headless rounds of hit/stand bots against the dealer
+
+        Bots only hit or stand following their hit tables; doubling down,
+        splitting, surrender and bets are not simulated, so results of the
+        default bots approximate, but do not match, their games in play_round.
+
+        Parameters:
+            n_rounds (int): Number of rounds to simulate
+            seed (Optional[int]): Seed for shuffling the decks, random if None
+            hit_tables (Optional[Dict[str, Sequence[bool]]]): Hit decision of
+                every bot indexed by hand score, by bot name; the Safe and Risk
+                Taker bots if None
+
+        Returns:
+            Dict[str, Tuple[int, int, int]]: Numbers of wins, pushes and losses
+                of every bot by name
+        """
+        if hit_tables is None:
+            hit_tables = {
+                "Safe Bot": SafePlayerStrategy.hit_table(),
+                "Risk Taker Bot": RiskTakerStrategy.hit_table(),
+            }
+
+        results = simulate_rounds(list(hit_tables.values()), n_rounds, seed)
+        return {
+            name: (int(wins), int(pushes), int(losses))
+            for name, (wins, pushes, losses) in zip(hit_tables, results)
+        }
 
     def add_player(self, player: Player) -> None:
         """
@@ -48,88 +185,94 @@ class Game:
 
     def place_bets(self) -> None:
         """Collect bets from all players and bots"""
-        print("Placing bets:")
+        self._say("Placing bets:")
         for player in self.players:
             while True:
                 try:
+                    self._flush()
                     bet = int(input(f"{player.name} bet (chips: {player.chips}): "))
                     if player.place_bet(bet):
                         break
                     else:
-                        print(f"Invalid bet! You have {player.chips} chips.")
+                        self._say(f"Invalid bet! You have {player.chips} chips.")
                 except ValueError:
-                    print("Please enter a valid number")
+                    self._say("Please enter a valid number")
 
         for bot in self.bots:
             bet = bot.calculate_bet()
             if bot.chips < 10:  # Minimum bet check
                 bet = bot.chips
-            if bot.place_bet(bet):
-                print(f"{bot.name} bets {bet}")
+            if bot.place_bet(bet) and self.verbose:
+                self._say(f"{bot.name} bets {bet}")
 
     def deal_initial_cards(self) -> None:
         """Deal initial two cards to all players and dealer"""
-        for _ in range(2):
-            for bot in self.bots:
-                bot.hand.add_card(self.deck.deal_card())
-            for player in self.players:
-                player.hand.add_card(self.deck.deal_card())
-            self.dealer.hand.add_card(self.deck.deal_card())
+        participants = self._seats
+        seats = len(participants)
+        cards = self.deck.deal_cards(2 * seats)
+        for seat, participant in enumerate(participants):
+            participant.hand.add_cards((cards[seat], cards[seat + seats]))
 
     def play_round(self) -> None:
         """Play one complete round of Blackjack"""
         self.current_round += 1
-        print(f"\nRound {self.current_round}")
+        self._say(f"\nRound {self.current_round}")
 
         self.place_bets()
 
-        for player in self.players + self.bots + [self.dealer]:
+        for player in self._everyone:
             player.clear_hand()
 
         self.deal_initial_cards()
 
         dealer_up_card = self.dealer.hand.cards[0]
-        print(f"Dealer shows: {dealer_up_card}")
+        if self.verbose:
+            self._say(f"Dealer shows: {dealer_up_card}")
 
         if dealer_up_card.rank == Rank.ACE:
             for player in self.players:
+                self._flush()
                 insurance = input(f"{player.name} - insurance? (y/n): ").lower()
                 if insurance == "y":
                     player.place_insurance()
 
+        self._flush()
         for player in self.players:
-            player.take_turn(self.deck, dealer_up_card)
+            player.take_turn(self.deck, dealer_up_card, self.dealer.hand.cards[1])
 
         for bot in self.bots:
             bot.play(self.deck)
 
-        print(f"Dealer: {[str(card) for card in self.dealer.hand.cards]}")
-        while self.dealer.hand.get_score() < 17:
-            card = self.deck.deal_card()
-            self.dealer.hand.add_card(card)
-            print(f"Dealer hits: {card}")
+        dealer_hand, deal_card = self.dealer.hand, self.deck.deal_card
+        if self.verbose:
+            self._say(f"Dealer: {', '.join(map(str, dealer_hand.cards))}")
+        while dealer_hand.get_score() < 17:
+            card = deal_card()
+            dealer_hand.add_card(card)
+            if self.verbose:
+                self._say(f"Dealer hits: {card}")
 
         dealer_score = self.dealer.hand.get_score()
         dealer_blackjack = self.dealer.hand.is_blackjack()
 
-        print(f"Dealer score: {dealer_score}")
-
-        for player in self.players + self.bots:
-            if player.split_hands:
-                for i, split_hand in enumerate(player.split_hands):
+        if self.verbose:
+            self._say(f"Dealer score: {dealer_score}")
+            for player in self._participants:
+                if player.split_hands:
+                    for i, split_hand in enumerate(player.split_hands):
+                        self._process_player_result(
+                            player, split_hand, dealer_score, dealer_blackjack, i
+                        )
+                else:
                     self._process_player_result(
-                        player, split_hand, dealer_score, dealer_blackjack, i
+                        player, player.hand, dealer_score, dealer_blackjack
                     )
-            else:
-                self._process_player_result(
-                    player, player.hand, dealer_score, dealer_blackjack
-                )
 
         self.update_chips()
 
         self.remove_bankrupt_players()
 
-        for player in self.players + self.bots + [self.dealer]:
+        for player in self._everyone:
             player.bet = 0
             player.insurance_bet = 0
             player.has_doubled = False
@@ -137,11 +280,13 @@ class Game:
 
         if (
             self.current_round >= self.max_rounds
-            or len(self.players + self.bots) == 0
+            or not self._participants
             or self.deck.cards_remaining() < 10
         ):
             self.game_over = True
 
+        self._flush()
+
     def _process_player_result(
         self,
         player: PlayerBase,
@@ -163,41 +308,41 @@ class Game:
         split_text = f" (split {split_index + 1})" if split_index >= 0 else ""
 
         if player.has_surrendered:
-            print(f"{player.name}{split_text}: surrendered")
+            self._say(f"{player.name}{split_text}: surrendered")
             return
 
         player_score = hand.get_score()
 
-        print(f"{player.name}{split_text}: {player_score}")
+        self._say(f"{player.name}{split_text}: {player_score}")
 
-        if hand.is_five_card_charlie():
-            print(f"{player.name}{split_text}: five card charlie - win")
-        elif hand.is_busted():
-            print(f"{player.name}{split_text}: bust - lose")
+        if player_score > 21:
+            self._say(f"{player.name}{split_text}: bust - lose")
+        elif len(hand.cards) >= 5:
+            self._say(f"{player.name}{split_text}: five card charlie - win")
         elif dealer_blackjack and hand.is_blackjack():
-            print(f"{player.name}{split_text}: push - both blackjack")
+            self._say(f"{player.name}{split_text}: push - both blackjack")
         elif dealer_blackjack:
-            print(f"{player.name}{split_text}: lose - dealer blackjack")
+            self._say(f"{player.name}{split_text}: lose - dealer blackjack")
         elif hand.is_blackjack():
-            print(f"{player.name}{split_text}: blackjack - win 3:2")
+            self._say(f"{player.name}{split_text}: blackjack - win 3:2")
         elif dealer_score > 21:
-            print(f"{player.name}{split_text}: win - dealer bust")
+            self._say(f"{player.name}{split_text}: win - dealer bust")
         elif player_score > dealer_score:
-            print(f"{player.name}{split_text}: win")
+            self._say(f"{player.name}{split_text}: win")
         elif player_score == dealer_score:
-            print(f"{player.name}{split_text}: push")
+            self._say(f"{player.name}{split_text}: push")
         else:
-            print(f"{player.name}{split_text}: lose")
+            self._say(f"{player.name}{split_text}: lose")
 
         if dealer_blackjack and player.insurance_bet > 0:
-            print(f"{player.name}: insurance pays 2:1")
+            self._say(f"{player.name}: insurance pays 2:1")
 
     def update_chips(self) -> None:
         """Update chip counts based on round results"""
         dealer_score = self.dealer.hand.get_score()
         dealer_blackjack = self.dealer.hand.is_blackjack()
 
-        for player in self.players + self.bots:
+        for player in self._participants:
             if player.has_surrendered:
                 refund = player.bet // 2
                 player.chips += refund
@@ -240,9 +385,10 @@ class Game:
             dealer_blackjack (bool): Whether dealer has blackjack
             bet (int): Bet amount for this hand
         """
-        if hand.is_busted():
+        score = hand.get_score()
+        if score > 21:
             pass
-        elif hand.is_five_card_charlie():
+        elif len(hand.cards) >= 5:
             player.chips += bet * 2
         elif dealer_blackjack:
             if hand.is_blackjack():
@@ -253,9 +399,9 @@ class Game:
             player.chips += total_win
         elif dealer_score > 21:
             player.chips += bet * 2
-        elif hand.get_score() > dealer_score:
+        elif score > dealer_score:
             player.chips += bet * 2
-        elif hand.get_score() == dealer_score:
+        elif score == dealer_score:
             player.chips += bet
 
     def remove_bankrupt_players(self) -> None:
@@ -265,29 +411,35 @@ class Game:
 
     def show_results(self) -> None:
         """Display current chip counts for all players"""
-        print("\nChip counts:")
-        for player in self.players + self.bots:
-            print(f"{player.name}: {player.chips}")
+        if not self.verbose:
+            return
+
+        self._say("\nChip counts:")
+        for player in self._participants:
+            self._say(f"{player.name}: {player.chips}")
+        self._flush()
 
     def start_game(self) -> None:
         """Start and run the main game loop"""
-        print("Welcome to Blackjack!")
-        print(f"Game will run for {self.max_rounds} rounds")
+        self._say("Welcome to Blackjack!")
+        self._say(f"Game will run for {self.max_rounds} rounds")
 
         while not self.game_over and self.current_round < self.max_rounds:
             self.play_round()
             self.show_results()
 
             if not self.game_over and self.current_round < self.max_rounds:
+                self._flush()
                 cont = input("\nContinue to next round? (y/n): ").lower()
                 if cont != "y":
                     break
 
             if self.deck.cards_remaining() < 10:
-                print("Shuffling new deck...")
-                self.deck = Deck()
+                self._say("Shuffling new deck...")
+                self.deck.reshuffle()
 
-        print(f"\nFinal winner: {self.get_final_winner()}")
+        self._say(f"\nFinal winner: {self.get_final_winner()}")
+        self._flush()
 
     def get_final_winner(self) -> str:
         """
@@ -296,9 +448,60 @@ class Game:
         Returns:
             str: Name and chips of the winner
         """
-        all_players = self.players + self.bots
-        if not all_players:
+        if not self._participants:
             return "No winners"
 
-        winner = max(all_players, key=lambda p: p.chips)
+        winner = max(self._participants, key=lambda p: p.chips)
         return f"{winner.name} with {winner.chips} chips"
+
+
+def _run_headless_game(arguments: Tuple[int, int]) -> Dict[str, int]:
+    """
+    Play one game with bots only and no console output
+
+    Parameters:
+        arguments (Tuple[int, int]): Seed for the deck and the strategies and
+            maximum number of rounds
+
+    Returns:
+        Dict[str, int]: Final chips of every bot left in the game by name
+    """
+    seed, max_rounds = arguments
+    seed_strategies(seed)
+    game = Game(max_rounds=max_rounds, verbose=False, seed=seed)
+    while not game.game_over and game.current_round < max_rounds:
+        game.play_round()
+    return {bot.name: bot.chips for bot in game.bots}
+
+
+def run_batch(
+    n_games: int, max_rounds: int = 5, processes: Optional[int] = None
+) -> List[Dict[str, int]]:
+    """
+    Play many independent bot-only games in parallel worker processes
+
+    Game i is seeded with i, so repeated calls return the same results.
+
+    Parameters:
+        n_games (int): Number of games to play
+        max_rounds (int): Maximum number of rounds in every game
+        processes (Optional[int]): Number of worker processes, one per CPU if None
+
+    Returns:
+        List[Dict[str, int]]: Final chips of the remaining bots in every game
+    """
+    with Pool(processes) as pool:
+        return pool.map(
+            _run_headless_game, [(seed, max_rounds) for seed in range(n_games)]
+        )
+
+
+def main() -> None:
+    """
+    Blackjack game main entry point
+
+    Initializes and starts a Blackjack game with human player and AI bots
+    """
+    game = Game(max_rounds=5)
+    game.add_player(Player("Player"))
+    game.start_game()
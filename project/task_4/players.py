@@ -1,6 +1,7 @@
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
 from project.task_4.core import Hand, Card, Deck
 from project.task_4.enums import StrategyType
+from project.task_4.simulation import deck_composition, expected_value
 from project.task_4.strategies import (
     SafePlayerStrategy,
     RiskTakerStrategy,
@@ -8,6 +9,22 @@ from project.task_4.strategies import (
     Strategy,
 )
 
+HIT, STAND, DOUBLE, SPLIT, SURRENDER = 1, 2, 4, 8, 16
+
+_ACTIONS = {
+    "hit": HIT,
+    "stand": STAND,
+    "double": DOUBLE,
+    "split": SPLIT,
+    "surrender": SURRENDER,
+}
+
+# Prompt text listing the allowed actions, indexed by action mask
+_PROMPTS = tuple(
+    "/".join(name for name, bit in _ACTIONS.items() if mask & bit)
+    for mask in range(2 * SURRENDER)
+)
+
 
 class PlayerBase:
     """
@@ -23,16 +40,34 @@ class PlayerBase:
         has_surrendered (bool): Whether player has surrendered
         split_hands (List[Hand]): List of hands after splitting
         split_bets (List[int]): List of bets for split hands
+        verbose (bool): Whether the player's moves are printed
+        _split_pool (Tuple[Hand, Hand]): Hands reused for splits in every round
     """
 
-    def __init__(self, name: str) -> None:
+    __slots__ = (
+        "name",
+        "hand",
+        "bet",
+        "chips",
+        "insurance_bet",
+        "has_doubled",
+        "has_surrendered",
+        "split_hands",
+        "split_bets",
+        "verbose",
+        "_split_pool",
+    )
+
+    def __init__(self, name: str, verbose: bool = True) -> None:
         """
         Initialize a player with default attributes
 
         Parameters:
             name (str): Player name
+            verbose (bool): Whether the player's moves are printed
         """
         self.name: str = name
+        self.verbose: bool = verbose
         self.hand: Hand = Hand()
         self.bet: int = 0
         self.chips: int = 1000
@@ -41,6 +76,7 @@ class PlayerBase:
         self.has_surrendered: bool = False
         self.split_hands: List[Hand] = []
         self.split_bets: List[int] = []
+        self._split_pool: Tuple[Hand, Hand] = (Hand(), Hand())
 
     def place_bet(self, amount: int) -> bool:
         """
@@ -108,9 +144,11 @@ class PlayerBase:
         Returns:
             bool: True if hand can be split, False otherwise
         """
+        cards = self.hand.cards
         return (
-            self.hand.can_split()
-            and len(self.split_hands) == 0
+            len(cards) == 2
+            and cards[0].rank is cards[1].rank
+            and not self.split_hands
             and self.bet * 2 <= self.chips
         )
 
@@ -126,15 +164,18 @@ class PlayerBase:
             if additional_bet <= self.chips:
                 self.chips -= additional_bet
 
-                hand1 = Hand()
-                hand2 = Hand()
+                hand = self.hand
+                first, second = hand.cards
+                hand1, hand2 = self._split_pool
+                hand1.clear()
+                hand2.clear()
 
-                hand1.add_card(self.hand.cards[0])
-                hand2.add_card(self.hand.cards[1])
+                hand1.add_card(first)
+                hand2.add_card(second)
 
-                self.split_hands = [hand1, hand2]
-                self.split_bets = [self.bet, self.bet]
-                self.hand.clear()
+                self.split_hands[:] = self._split_pool
+                self.split_bets[:] = (self.bet, self.bet)
+                hand.clear()
                 return True
         return False
 
@@ -166,15 +207,23 @@ class Bot(PlayerBase):
         _strategy_obj (Strategy): Strategy object
     """
 
-    def __init__(self, name: str, strategy: StrategyType = StrategyType.SAFE) -> None:
+    __slots__ = ("strategy", "_strategy_obj")
+
+    def __init__(
+        self,
+        name: str,
+        strategy: StrategyType = StrategyType.SAFE,
+        verbose: bool = True,
+    ) -> None:
         """
         Initialize a bot player
 
         Parameters:
             name (str): Bot's name
             strategy (StrategyType): Playing strategy
+            verbose (bool): Whether the bot prints its moves
         """
-        super().__init__(name)
+        super().__init__(name, verbose)
         self.strategy: StrategyType = strategy
         self._strategy_obj = self._create_strategy(strategy)
 
@@ -213,6 +262,10 @@ class Bot(PlayerBase):
         Parameters:
             deck (Deck): Deck to draw cards from
         """
+        if not self.verbose:
+            self._strategy_obj.play(self, deck)
+            return
+
         print(f"{self.name} ({self.strategy.value}): ", end="")
         if self.strategy == StrategyType.SAFE:
             print("Bot with safe strategy")
@@ -227,11 +280,11 @@ class Bot(PlayerBase):
             for i, hand in enumerate(self.split_hands):
                 split_text = f" (split {i + 1})" if len(self.split_hands) > 1 else ""
                 print(
-                    f"{self.name}{split_text}: {[str(card) for card in hand.cards]} (Score: {hand.get_score()})"
+                    f"{self.name}{split_text}: {', '.join(map(str, hand.cards))} (Score: {hand.get_score()})"
                 )
         else:
             print(
-                f"{self.name}: {[str(card) for card in self.hand.cards]} (Score: {self.hand.get_score()})"
+                f"{self.name}: {', '.join(map(str, self.hand.cards))} (Score: {self.hand.get_score()})"
             )
 
 
@@ -240,33 +293,71 @@ class Player(PlayerBase):
     Human player that interacts through console input
     """
 
-    def __init__(self, name: str) -> None:
+    __slots__ = ()
+
+    def __init__(self, name: str, verbose: bool = True) -> None:
         """
         Initialize a human player
 
         Parameters:
             name (str): Player's name
+            verbose (bool): Whether the player's moves are printed
         """
-        super().__init__(name)
+        super().__init__(name, verbose)
 
-    def take_turn(self, deck: Deck, dealer_up_card: Card) -> None:
+    def take_turn(
+        self, deck: Deck, dealer_up_card: Card, dealer_hole_card: Optional[Card] = None
+    ) -> None:
         """
         Execute player's turn with console interaction
 
         Parameters:
             deck (Deck): Deck to draw cards from
             dealer_up_card (Card): Dealer's visible card
+            dealer_hole_card (Optional[Card]): Dealer's hidden card, counted as
+                unseen for hints; no hints are shown if None
         """
         if self.split_hands:
             for i, split_hand in enumerate(self.split_hands):
-                print(f"Playing split hand {i + 1}")
-                self._play_single_hand(deck, dealer_up_card, split_hand, True)
+                if self.verbose:
+                    print(f"Playing split hand {i + 1}")
+                self._play_single_hand(
+                    deck, dealer_up_card, split_hand, True, dealer_hole_card
+                )
             return
 
-        self._play_single_hand(deck, dealer_up_card, self.hand, False)
+        self._play_single_hand(deck, dealer_up_card, self.hand, False, dealer_hole_card)
+
+    def _stand_hint(
+        self, deck: Deck, dealer_up_card: Card, hand: Hand, dealer_hole_card: Card
+    ) -> str:
+        """
+        Describe the expected result of standing with a hand
+
+        Cards left in the deck and the dealer's hole card are the unseen cards
+        the dealer can still draw.
+
+        Parameters:
+            deck (Deck): Deck the dealer draws from
+            dealer_up_card (Card): Dealer's visible card
+            hand (Hand): Hand being played
+            dealer_hole_card (Card): Dealer's hidden card
+
+        Returns:
+            str: Hint for the console
+        """
+        composition = list(deck_composition(deck.codes))
+        composition[dealer_hole_card.get_value() - 2] += 1
+        value = expected_value(hand, dealer_up_card, tuple(composition))
+        return f"Hint: standing is worth {value:+.2f} per chip bet"
 
     def _play_single_hand(
-        self, deck: Deck, dealer_up_card: Card, hand: Hand, is_split: bool
+        self,
+        deck: Deck,
+        dealer_up_card: Card,
+        hand: Hand,
+        is_split: bool,
+        dealer_hole_card: Optional[Card] = None,
     ) -> None:
         """
         Play a single hand with user interaction
@@ -276,51 +367,135 @@ class Player(PlayerBase):
             dealer_up_card (Card): Dealer's visible card
             hand (Hand): Hand to play
             is_split (bool): Whether this is a split hand
+            dealer_hole_card (Optional[Card]): Dealer's hidden card, used for hints
         """
         while not hand.is_busted() and not self.has_surrendered:
-            print(
-                f"{self.name}: {[str(card) for card in hand.cards]} (Score: {hand.get_score()})"
-            )
+            if self.verbose:
+                print(
+                    f"{self.name}: {', '.join(map(str, hand.cards))} (Score: {hand.get_score()})"
+                )
+                if dealer_hole_card is not None:
+                    print(
+                        self._stand_hint(deck, dealer_up_card, hand, dealer_hole_card)
+                    )
+
+            allowed = HIT | STAND
+            if not is_split:
+                if self.can_double():
+                    allowed |= DOUBLE
+                if self.can_split():
+                    allowed |= SPLIT
+                if len(hand.cards) == 2 and not self.has_doubled:
+                    allowed |= SURRENDER
+
+            choice = input(f"Action ({_PROMPTS[allowed]}): ").lower()
+            action = _ACTIONS.get(choice, 0) & allowed
+
+            handler = self._HANDLERS.get(action)
+            if handler is not None and handler(self, deck, hand):
+                return
+
+    def _hit(self, deck: Deck, hand: Hand) -> bool:
+        """
+        Take one more card
 
-            actions = ["hit", "stand"]
-            if self.can_double() and not is_split:
-                actions.append("double")
-            if self.can_split() and not is_split:
-                actions.append("split")
-            if len(hand.cards) == 2 and not self.has_doubled and not is_split:
-                actions.append("surrender")
-
-            action = input(f"Action ({'/'.join(actions)}): ").lower()
-
-            if action == "hit":
-                card = deck.deal_card()
-                hand.add_card(card)
-                print(f"Got: {card}")
-
-                if hand.is_five_card_charlie():
-                    print("Five Card - automatic win!")
-                    return
-
-                if hand.is_busted():
-                    print("Busted!")
-                    break
-
-            elif action == "stand":
-                break
-
-            elif action == "double" and "double" in actions:
-                if self.double_bet():
-                    card = deck.deal_card()
-                    hand.add_card(card)
-                    print(f"Doubled - got: {card}")
-                    break
-
-            elif action == "split" and "split" in actions:
-                if self.split_hand():
-                    print("Hand split")
-                    return
-
-            elif action == "surrender" and "surrender" in actions:
-                if self.surrender():
-                    print("Surrendered - lose half bet")
-                    break
+        Parameters:
+            deck (Deck): Deck to draw cards from
+            hand (Hand): Hand being played
+
+        Returns:
+            bool: True if the hand is finished, False otherwise
+        """
+        card = deck.deal_card()
+        hand.add_card(card)
+        if self.verbose:
+            print(f"Got: {card}")
+
+        if hand.is_five_card_charlie():
+            if self.verbose:
+                print("Five Card - automatic win!")
+            return True
+
+        if hand.is_busted():
+            if self.verbose:
+                print("Busted!")
+            return True
+
+        return False
+
+    def _stand(self, deck: Deck, hand: Hand) -> bool:
+        """
+        Keep the current hand
+
+        Parameters:
+            deck (Deck): Deck to draw cards from
+            hand (Hand): Hand being played
+
+        Returns:
+            bool: Always True, the hand is finished
+        """
+        return True
+
+    def _double(self, deck: Deck, hand: Hand) -> bool:
+        """
+        Double the bet and take exactly one more card
+
+        Parameters:
+            deck (Deck): Deck to draw cards from
+            hand (Hand): Hand being played
+
+        Returns:
+            bool: True if the bet was doubled, False otherwise
+        """
+        if not self.double_bet():
+            return False
+
+        card = deck.deal_card()
+        hand.add_card(card)
+        if self.verbose:
+            print(f"Doubled - got: {card}")
+        return True
+
+    def _split(self, deck: Deck, hand: Hand) -> bool:
+        """
+        Split the hand into two hands
+
+        Parameters:
+            deck (Deck): Deck to draw cards from
+            hand (Hand): Hand being played
+
+        Returns:
+            bool: True if the hand was split, False otherwise
+        """
+        if not self.split_hand():
+            return False
+
+        if self.verbose:
+            print("Hand split")
+        return True
+
+    def _surrender(self, deck: Deck, hand: Hand) -> bool:
+        """
+        Give up the hand for half of the bet
+
+        Parameters:
+            deck (Deck): Deck to draw cards from
+            hand (Hand): Hand being played
+
+        Returns:
+            bool: True if the player surrendered, False otherwise
+        """
+        if not self.surrender():
+            return False
+
+        if self.verbose:
+            print("Surrendered - lose half bet")
+        return True
+
+    _HANDLERS: Dict[int, Callable[["Player", Deck, Hand], bool]] = {
+        HIT: _hit,
+        STAND: _stand,
+        DOUBLE: _double,
+        SPLIT: _split,
+        SURRENDER: _surrender,
+    }
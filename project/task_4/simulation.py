@@ -0,0 +1,280 @@
+from functools import lru_cache
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from project.task_4.core import Card, Hand
+
+DECK_SIZE = 52
+DEALER_STAND_SCORE = 17
+
+# A hand that has not busted holds at most 11 cards (four Aces, four 2s and
+# three 3s), so no hand takes more than 12 cards
+MAX_HAND_CARDS = 12
+
+CARD_VALUES = np.array(
+    [Card.from_code(code).get_value() for code in range(DECK_SIZE)], dtype=np.int16
+)
+
+# Dealer outcomes are final scores 17..21 followed by bust
+DEALER_OUTCOMES = (17, 18, 19, 20, 21, 22)
+
+# Dealer states kept by _dealer_distribution; one full deck needs about 5000
+DISTRIBUTION_CACHE_SIZE = 1 << 15
+
+
+def _add_cards(
+    score: np.ndarray, aces: np.ndarray, values: np.ndarray, mask: np.ndarray
+) -> None:
+    """
+    Add one card to every hand selected by mask, adjusting Aces to prevent busting
+
+    Parameters:
+        score (np.ndarray): Scores of the hands, updated in place
+        aces (np.ndarray): Aces still counted as 11 in every hand, updated in place
+        values (np.ndarray): Value of the card added to every hand
+        mask (np.ndarray): Hands that take the card
+    """
+    score += values * mask
+    aces += (values == 11) & mask
+    while True:
+        soften = (score > 21) & (aces > 0)
+        if not soften.any():
+            return
+        score -= 10 * soften
+        aces -= soften
+
+
+def simulate_rounds(
+    hit_tables: Sequence[Sequence[bool]], n_rounds: int, seed: Optional[int] = None
+) -> np.ndarray:
+    """
+    Play many independent rounds of bots against the dealer at once
+
+    Every round uses its own shuffled deck. If the seats could need more cards
+    than one deck holds, every round continues into further independently
+    shuffled decks. Bots hit while their hit table says so and they have not
+    busted, and the dealer hits below DEALER_STAND_SCORE. Rounds advance
+    together as rows of NumPy arrays, so the work per card is a few vectorized
+    operations over all rounds. Doubling down, splitting, surrender and bets
+    are not simulated.
+
+    Parameters:
+        hit_tables (Sequence[Sequence[bool]]): Hit decision of every bot indexed
+            by hand score, in seat order
+        n_rounds (int): Number of rounds to play
+        seed (Optional[int]): Seed for shuffling the decks, random if None
+
+    Returns:
+        np.ndarray: Array of shape (len(hit_tables), 3) with the numbers of
+            wins, pushes and losses of every bot
+    """
+    seats = len(hit_tables) + 1
+    n_decks = -(-MAX_HAND_CARDS * seats // DECK_SIZE)
+
+    rng = np.random.default_rng(seed)
+    decks = np.tile(np.arange(DECK_SIZE, dtype=np.uint8), (n_rounds, n_decks, 1))
+    shuffled = rng.permuted(decks, axis=2).reshape(n_rounds, n_decks * DECK_SIZE)
+    values = CARD_VALUES[shuffled]
+    rounds = np.arange(n_rounds)
+
+    score = np.zeros((seats, n_rounds), dtype=np.int16)
+    aces = np.zeros((seats, n_rounds), dtype=np.int16)
+    taking = np.ones(n_rounds, dtype=bool)
+    for row in range(2):
+        for seat in range(seats):
+            _add_cards(score[seat], aces[seat], values[:, row * seats + seat], taking)
+    count = np.full((seats, n_rounds), 2, dtype=np.int16)
+
+    position = np.full(n_rounds, 2 * seats)
+    for seat, table in enumerate(hit_tables):
+        hit_table = np.array(table, dtype=bool)
+        while True:
+            hitting = hit_table[np.minimum(score[seat], len(hit_table) - 1)]
+            hitting &= score[seat] <= 21
+            if not hitting.any():
+                break
+            _add_cards(score[seat], aces[seat], values[rounds, position], hitting)
+            count[seat] += hitting
+            position += hitting
+
+    dealer_score, dealer_aces = score[-1], aces[-1]
+    dealer_blackjack = dealer_score == 21
+    while True:
+        hitting = dealer_score < DEALER_STAND_SCORE
+        if not hitting.any():
+            break
+        _add_cards(dealer_score, dealer_aces, values[rounds, position], hitting)
+        position += hitting
+
+    results = np.zeros((len(hit_tables), 3), dtype=np.int64)
+    for seat in range(len(hit_tables)):
+        wins, pushes = _compare_with_dealer(
+            score[seat], count[seat], dealer_score, dealer_blackjack
+        )
+        results[seat] = wins.sum(), pushes.sum(), n_rounds - wins.sum() - pushes.sum()
+
+    return results
+
+
+def _compare_with_dealer(
+    score: np.ndarray,
+    count: np.ndarray,
+    dealer_score: np.ndarray,
+    dealer_blackjack: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decide the outcome of every round for one bot, following Game rules
+
+    Parameters:
+        score (np.ndarray): Final scores of the bot
+        count (np.ndarray): Number of cards in the bot's hands
+        dealer_score (np.ndarray): Final scores of the dealer
+        dealer_blackjack (np.ndarray): Whether the dealer has blackjack
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Masks of won and pushed rounds
+    """
+    busted = score > 21
+    charlie = (count >= 5) & ~busted
+    blackjack = (count == 2) & (score == 21)
+    settled = busted | charlie | dealer_blackjack | blackjack
+
+    wins = charlie | (~busted & ~dealer_blackjack & blackjack)
+    wins |= ~settled & ((dealer_score > 21) | (score > dealer_score))
+    pushes = ~busted & ~charlie & dealer_blackjack & blackjack
+    pushes |= ~settled & (dealer_score <= 21) & (score == dealer_score)
+    return wins, pushes
+
+
+def deck_composition(codes: Iterable[int]) -> Tuple[int, ...]:
+    """
+    Count cards of every value among the given card codes
+
+    Parameters:
+        codes (Iterable[int]): Card codes, e.g. Deck.codes
+
+    Returns:
+        Tuple[int, ...]: Numbers of cards with values 2..11
+    """
+    counts = [0] * 10
+    for code in codes:
+        counts[CARD_VALUES[code] - 2] += 1
+    return tuple(counts)
+
+
+@lru_cache(maxsize=DISTRIBUTION_CACHE_SIZE)
+def _dealer_distribution(
+    score: int, aces: int, composition: Tuple[int, ...]
+) -> Tuple[float, ...]:
+    """
+    Get probabilities of the dealer outcomes from a given state
+
+    States are cached by score, soft Aces and remaining deck composition, so
+    every composition reached while drawing is expanded only once, across all
+    rounds and hands that lead to it. The cache keeps the most recently used
+    DISTRIBUTION_CACHE_SIZE states.
+
+    Parameters:
+        score (int): Dealer's current score
+        aces (int): Aces still counted as 11 in the dealer's hand
+        composition (Tuple[int, ...]): Numbers of remaining cards with values 2..11
+
+    Returns:
+        Tuple[float, ...]: Probabilities of DEALER_OUTCOMES
+    """
+    if score >= DEALER_STAND_SCORE:
+        final = [0.0] * len(DEALER_OUTCOMES)
+        final[min(score, 22) - 17] = 1.0
+        return tuple(final)
+
+    total = sum(composition)
+    if total == 0:
+        return _dealer_distribution(DEALER_STAND_SCORE, 0, composition)
+
+    result = [0.0] * len(DEALER_OUTCOMES)
+    remaining = list(composition)
+    for index, count in enumerate(composition):
+        if count == 0:
+            continue
+        value = index + 2
+        new_score = score + value
+        new_aces = aces + (value == 11)
+        if new_score > 21 and new_aces > 0:
+            new_score -= 10
+            new_aces -= 1
+
+        remaining[index] -= 1
+        branch = _dealer_distribution(new_score, new_aces, tuple(remaining))
+        remaining[index] += 1
+
+        probability = count / total
+        for outcome, outcome_probability in enumerate(branch):
+            result[outcome] += probability * outcome_probability
+
+    return tuple(result)
+
+
+def dealer_distribution(
+    up_card: Card, composition: Tuple[int, ...]
+) -> Tuple[float, ...]:
+    """
+    Get probabilities of the dealer's final results given the up-card
+
+    Parameters:
+        up_card (Card): Dealer's visible card
+        composition (Tuple[int, ...]): Numbers of unseen cards with values 2..11,
+            see deck_composition
+
+    Returns:
+        Tuple[float, ...]: Probabilities of DEALER_OUTCOMES, i.e. final scores
+            17..21 and bust
+    """
+    value = up_card.get_value()
+    return _dealer_distribution(value, int(value == 11), composition)
+
+
+def expected_value(hand: Hand, up_card: Card, composition: Tuple[int, ...]) -> float:
+    """
+    Get the expected result of standing with a hand, per unit of bet
+
+    Outcomes follow Game._process_payout: a bust loses, five cards win, a
+    dealer blackjack beats everything but a player blackjack, and a player
+    blackjack otherwise pays 3:2.
+
+    Parameters:
+        hand (Hand): Hand that stands
+        up_card (Card): Dealer's visible card
+        composition (Tuple[int, ...]): Numbers of unseen cards with values 2..11,
+            including the dealer's hole card
+
+    Returns:
+        float: Expected winnings minus expected losses per unit of bet
+    """
+    score = hand.get_score()
+    if score > 21:
+        return -1.0
+    if len(hand.cards) >= 5:
+        return 1.0
+
+    # The dealer has blackjack when the hole card completes 21 with the up-card
+    total = sum(composition)
+    up_value = up_card.get_value()
+    dealer_blackjack = 0.0
+    if total and up_value in (10, 11):
+        dealer_blackjack = composition[21 - up_value - 2] / total
+
+    if hand.is_blackjack():
+        return 1.5 * (1.0 - dealer_blackjack)
+
+    value = -dealer_blackjack
+    for dealer_score, probability in zip(
+        DEALER_OUTCOMES, dealer_distribution(up_card, composition)
+    ):
+        if dealer_score == 21:
+            probability -= dealer_blackjack
+        if dealer_score > 21 or score > dealer_score:
+            value += probability
+        elif score < dealer_score:
+            value -= probability
+    return value
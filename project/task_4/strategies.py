@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
-import random
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Tuple
+
+import numpy as np
 
 from project.task_4.enums import Rank
 
@@ -8,9 +9,180 @@ if TYPE_CHECKING:
     from project.task_4.players import PlayerBase
     from project.task_4.core import Deck
 
+MAX_SCORE = 31
+MIN_BET = 10
+
+# Decisions stored in Strategy._ACTION_TABLE
+STAND, HIT, DOUBLE = 0, 1, 2
+
+
+class RandomPool:
+    """
+    Source of random numbers drawn from NumPy in batches
+
+    Every distinct integer range, and floats in [0, 1), get their own batch of
+    batch_size numbers drawn with a single Generator call, so taking a number
+    is a next() on a list iterator instead of a trip through the random module.
+
+    Attributes:
+        batch_size (int): Number of values drawn at once for every range
+        _rng (np.random.Generator): Generator the batches are drawn from
+        _integers (Dict[Tuple[int, int], Iterator[int]]): Remaining batches of integers
+        _floats (Iterator[float]): Remaining batch of floats in [0, 1)
+    """
+
+    def __init__(self, batch_size: int = 1024, seed: Optional[int] = None) -> None:
+        """
+        Initialize an empty pool
+
+        Parameters:
+            batch_size (int): Number of values drawn at once for every range
+            seed (Optional[int]): Seed for the generator, random if None
+        """
+        self.batch_size = batch_size
+        self._integers: Dict[Tuple[int, int], Iterator[int]] = {}
+        self.reseed(seed)
+
+    def reseed(self, seed: Optional[int] = None) -> None:
+        """
+        Restart the pool from a new generator, dropping numbers drawn so far
+
+        Parameters:
+            seed (Optional[int]): Seed for the generator, random if None
+        """
+        self._rng = np.random.default_rng(seed)
+        self._integers.clear()
+        self._floats: Iterator[float] = iter(())
+
+    def randint(self, low: int, high: int) -> int:
+        """
+        Get a random integer in range [low, high], including both end points
+
+        Parameters:
+            low (int): Smallest possible value
+            high (int): Largest possible value
+
+        Returns:
+            int: Random integer
+        """
+        key = (low, high)
+        try:
+            return next(self._integers[key])
+        except (KeyError, StopIteration):
+            batch = self._rng.integers(low, high + 1, size=self.batch_size)
+            self._integers[key] = iter(batch.tolist())
+            return next(self._integers[key])
+
+    def random(self) -> float:
+        """
+        Get a random float in range [0, 1)
+
+        Returns:
+            float: Random float
+        """
+        try:
+            return next(self._floats)
+        except StopIteration:
+            self._floats = iter(self._rng.random(self.batch_size).tolist())
+            return next(self._floats)
+
+    def uniform(self, low: float, high: float) -> float:
+        """
+        Get a random float in range [low, high)
+
+        Parameters:
+            low (float): Smallest possible value
+            high (float): Upper bound of the values
+
+        Returns:
+            float: Random float
+        """
+        return low + (high - low) * self.random()
+
+
+_POOL = RandomPool()
+
+
+def seed_strategies(seed: Optional[int] = None) -> None:
+    """
+    Reseed the random sources shared by all strategies
+
+    Worker processes forked from one parent inherit the same pool state, so
+    each of them should call this with its own seed.
+
+    Parameters:
+        seed (Optional[int]): Seed for the random sources, random if None
+    """
+    _POOL.reseed(seed)
+
 
 class Strategy(ABC):
-    """Abstract base class for bot strategies"""
+    """
+    Abstract base class for bot strategies
+
+    The deterministic rules `should_hit` and `should_double` are evaluated once
+    for every possible hand score when a subclass is created, so strategies can
+    look decisions up in `_HIT_TABLE`, `_DOUBLE_TABLE` and `_ACTION_TABLE` while
+    playing.
+
+    Attributes:
+        _HIT_TABLE (Tuple[bool, ...]): `should_hit` result indexed by hand score
+        _DOUBLE_TABLE (Tuple[bool, ...]): `should_double` result indexed by hand score
+        _ACTION_TABLE (Tuple[Tuple[int, ...], ...]): STAND, HIT or DOUBLE indexed
+            by whether doubling is allowed and then by hand score
+    """
+
+    _HIT_TABLE: Tuple[bool, ...] = ()
+    _DOUBLE_TABLE: Tuple[bool, ...] = ()
+    _ACTION_TABLE: Tuple[Tuple[int, ...], ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        scores = range(MAX_SCORE + 1)
+        cls._HIT_TABLE = tuple(cls.should_hit(score) for score in scores)
+        cls._DOUBLE_TABLE = tuple(cls.should_double(score) for score in scores)
+        without_double = tuple(HIT if hit else STAND for hit in cls._HIT_TABLE)
+        with_double = tuple(
+            DOUBLE if double else action
+            for double, action in zip(cls._DOUBLE_TABLE, without_double)
+        )
+        cls._ACTION_TABLE = (without_double, with_double)
+
+    @classmethod
+    def hit_table(cls) -> Tuple[bool, ...]:
+        """
+        Get the hit decisions of the strategy for every hand score
+
+        Returns:
+            Tuple[bool, ...]: `should_hit` result indexed by hand score up to MAX_SCORE
+        """
+        return cls._HIT_TABLE
+
+    @staticmethod
+    def should_hit(score: int) -> bool:
+        """
+        Decide whether to take another card with the given hand score
+
+        Parameters:
+            score (int): Current hand score
+
+        Returns:
+            bool: True to hit, False to stand
+        """
+        return False
+
+    @staticmethod
+    def should_double(score: int) -> bool:
+        """
+        Decide whether to double down on a two-card hand with the given score
+
+        Parameters:
+            score (int): Current hand score
+
+        Returns:
+            bool: True to double down, False otherwise
+        """
+        return False
 
     @abstractmethod
     def play(self, player: "PlayerBase", deck: "Deck") -> None:
@@ -23,18 +195,40 @@ class Strategy(ABC):
         """
         pass
 
-    @abstractmethod
     def calculate_bet(self, player: "PlayerBase") -> int:
         """
         Calculate bet amount based on strategy and player's chips
 
+        Strategies that do not vary their bets can rely on this flat default.
+
         Parameters:
             player (PlayerBase): The player placing the bet
 
         Returns:
             int: Bet amount
         """
-        pass
+        return MIN_BET
+
+    def _play_single_hand(self, player: "PlayerBase", hand, deck: "Deck") -> None:
+        """
+        Play a single hand by looking decisions up in `_ACTION_TABLE`
+
+        Parameters:
+            player (PlayerBase): The player using this strategy
+            hand: The hand to play
+            deck (Deck): The deck to draw cards from
+        """
+        can_double = player.can_double() and len(hand.cards) == 2
+        if self._ACTION_TABLE[can_double][hand.get_score()] == DOUBLE:
+            player.double_bet()
+            hand.add_card(deck.deal_card())
+            return
+
+        hit = self._ACTION_TABLE[False]
+        deal_card, add_card, get_score = deck.deal_card, hand.add_card, hand.get_score
+        is_busted = hand.is_busted
+        while not is_busted() and hit[get_score()]:
+            add_card(deal_card())
 
 
 class SafePlayerStrategy(Strategy):
@@ -43,6 +237,8 @@ class SafePlayerStrategy(Strategy):
     Stands on 14+, rarely doubles down, splits only Aces and 8s
     """
 
+    _SPLIT_RANKS = (Rank.ACE, Rank.EIGHT)
+
     def calculate_bet(self, player: "PlayerBase") -> int:
         """
         Calculate conservative bet amount (5-10% of chips)
@@ -56,6 +252,14 @@ class SafePlayerStrategy(Strategy):
         base_bet = max(10, player.chips // 20)
         return min(base_bet, 100)
 
+    @staticmethod
+    def should_hit(score: int) -> bool:
+        return score < 14
+
+    @staticmethod
+    def should_double(score: int) -> bool:
+        return score == 11
+
     def play(self, player: "PlayerBase", deck: "Deck") -> None:
         """
         Execute safe playing strategy
@@ -64,7 +268,7 @@ class SafePlayerStrategy(Strategy):
             player (PlayerBase): The player using this strategy
             deck (Deck): The deck to draw cards from
         """
-        if player.can_split() and player.hand.cards[0].rank in [Rank.ACE, Rank.EIGHT]:
+        if player.hand.cards[0].rank in self._SPLIT_RANKS and player.can_split():
             player.split_hand()
             for hand in player.split_hands:
                 self._play_single_hand(player, hand, deck)
@@ -72,25 +276,6 @@ class SafePlayerStrategy(Strategy):
 
         self._play_single_hand(player, player.hand, deck)
 
-    def _play_single_hand(self, player: "PlayerBase", hand, deck: "Deck") -> None:
-        """
-        Play a single hand with safe strategy
-
-        Parameters:
-            player (PlayerBase): The player using this strategy
-            hand: The hand to play
-            deck (Deck): The deck to draw cards from
-        """
-        if player.can_double() and len(hand.cards) == 2 and hand.get_score() == 11:
-            player.double_bet()
-            new_card = deck.deal_card()
-            hand.add_card(new_card)
-            return
-
-        while hand.get_score() < 14 and not hand.is_busted():
-            new_card = deck.deal_card()
-            hand.add_card(new_card)
-
 
 class RiskTakerStrategy(Strategy):
     """
@@ -109,9 +294,17 @@ class RiskTakerStrategy(Strategy):
             int: Bet amount
         """
         base_bet = max(20, player.chips // 6)
-        variation = random.randint(-10, 20)
+        variation = _POOL.randint(-10, 20)
         return min(base_bet + variation, 200)
 
+    @staticmethod
+    def should_hit(score: int) -> bool:
+        return score < 19
+
+    @staticmethod
+    def should_double(score: int) -> bool:
+        return score in (9, 10, 11)
+
     def play(self, player: "PlayerBase", deck: "Deck") -> None:
         """
         Execute risk taker playing strategy
@@ -128,29 +321,6 @@ class RiskTakerStrategy(Strategy):
 
         self._play_single_hand(player, player.hand, deck)
 
-    def _play_single_hand(self, player: "PlayerBase", hand, deck: "Deck") -> None:
-        """
-        Play a single hand with risk taker strategy
-
-        Parameters:
-            player (PlayerBase): The player using this strategy
-            hand: The hand to play
-            deck (Deck): The deck to draw cards from
-        """
-        if (
-            player.can_double()
-            and len(hand.cards) == 2
-            and hand.get_score() in [9, 10, 11]
-        ):
-            player.double_bet()
-            new_card = deck.deal_card()
-            hand.add_card(new_card)
-            return
-
-        while hand.get_score() < 19 and not hand.is_busted():
-            new_card = deck.deal_card()
-            hand.add_card(new_card)
-
 
 class UnpredictableStrategy(Strategy):
     """
@@ -168,11 +338,15 @@ class UnpredictableStrategy(Strategy):
         Returns:
             int: Bet amount
         """
-        percentage = random.uniform(0.05, 0.20)
+        percentage = _POOL.uniform(0.05, 0.20)
         base_bet = max(10, int(player.chips * percentage))
-        variation = random.randint(-15, 30)
+        variation = _POOL.randint(-15, 30)
         return min(base_bet + variation, 150)
 
+    @staticmethod
+    def should_double(score: int) -> bool:
+        return score in (9, 10, 11)
+
     def play(self, player: "PlayerBase", deck: "Deck") -> None:
         """
         Execute unpredictable playing strategy
@@ -181,7 +355,7 @@ class UnpredictableStrategy(Strategy):
             player (PlayerBase): The player using this strategy
             deck (Deck): The deck to draw cards from
         """
-        if player.can_split() and random.random() < 0.5:
+        if player.can_split() and _POOL.random() < 0.5:
             player.split_hand()
             for hand in player.split_hands:
                 self._play_single_hand(player, hand, deck)
@@ -203,20 +377,20 @@ class UnpredictableStrategy(Strategy):
         if (
             player.can_double()
             and len(hand.cards) == 2
-            and current_score in [9, 10, 11]
-            and random.random() < 0.4
+            and self._DOUBLE_TABLE[current_score]
+            and _POOL.random() < 0.4
         ):
             player.double_bet()
             new_card = deck.deal_card()
             hand.add_card(new_card)
             return
 
-        while current_score < 21 and not hand.is_busted():
+        deal_card = deck.deal_card
+        while current_score < 21:
             stand_chance = min(0.3 + (current_score - 12) * 0.1, 0.8)
 
-            if random.random() < stand_chance:
+            if _POOL.random() < stand_chance:
                 break
 
-            new_card = deck.deal_card()
-            hand.add_card(new_card)
+            hand.add_card(deal_card())
             current_score = hand.get_score()
@@ -1,6 +1,10 @@
 from collections.abc import MutableMapping
 from typing import Any, Optional, Iterator, Tuple, List
 
+# Marks a slot whose pair was removed, so probe sequences passing through it go on.
+# hash() never returns -1, so the marker's hash matches no key.
+_TOMBSTONE: Tuple[int, Any, Any] = (-1, object(), None)
+
 
 class HashTable(MutableMapping):
     """
@@ -10,9 +14,12 @@ class HashTable(MutableMapping):
     functionality with key-value pair storage and retrieval.
 
     Attributes:
-        _size (int): Current size of the internal hash table
-        _table (List[Optional[Tuple[Any, Any]]]): Internal storage array
+        _size (int): Current size of the internal hash table, a power of two
+        _bits (int): Base two logarithm of the size
+        _table (List[Optional[Tuple[int, Any, Any]]]): Internal storage array of
+            (hash, key, value) triples
         _count (int): Number of key-value pairs currently stored
+        _tombstones (int): Number of slots holding a removed pair marker
     """
 
     def __init__(self, initial_size: int = 13) -> None:
@@ -20,51 +27,32 @@ class HashTable(MutableMapping):
         Initialize the hash table.
 
         Parameters:
-            initial_size (int): Initial size of the hash table. Defaults to 13.
+            initial_size (int): Initial size of the hash table, rounded up to
+                a power of two. Defaults to 13.
         """
-        self._size = initial_size
-        self._table: List[Optional[Tuple[Any, Any]]] = [None] * self._size
+        self._bits = max(1, (initial_size - 1).bit_length())
+        self._size = 1 << self._bits
+        self._table: List[Optional[Tuple[int, Any, Any]]] = [None] * self._size
         self._count = 0
+        self._tombstones = 0
 
-    def _hash1(self, key: Any) -> int:
+    def _probe_start(self, key_hash: int) -> Tuple[int, int]:
         """
-        Compute the primary hash value for a key.
-
-        Parameters:
-            key (Any): Key to hash
+        Compute the double hashing parameters for a key hash.
 
-        Returns:
-            int: Primary hash index in range [0, size-1]
-        """
-        return hash(key) % self._size
-
-    def _hash2(self, key: Any) -> int:
-        """
-        Compute the secondary hash value for collision resolution.
+        Probing visits (start + i * step) & (size - 1) for i = 0, 1, ..., size - 1.
+        The step is taken from the hash bits above the start index and is always
+        odd, so with a power of two size the sequence covers every slot.
 
         Parameters:
-            key (Any): Key to hash
+            key_hash (int): Hash of the key, computed once per operation
 
         Returns:
-            int: Secondary hash value in range [1, size-1]
+            Tuple[int, int]: First index in range [0, size-1] and odd probe step
+                in range [1, size-1]
         """
-        return 1 + (hash(key) % (self._size - 1))
-
-    def _probe_sequence(self, key: Any) -> Iterator[int]:
-        """
-        Generate a probe sequence using double hashing.
-
-        Parameters:
-            key (Any): Key to generate probe sequence for
-
-        Yields:
-            Iterator[int]: Sequence of indices to probe
-        """
-        h1 = self._hash1(key)
-        h2 = self._hash2(key)
-
-        for i in range(self._size):
-            yield (h1 + i * h2) % self._size
+        mask = self._size - 1
+        return key_hash & mask, ((key_hash >> self._bits) | 1) & mask
 
     def _add(self, key: Any, value: Any) -> None:
         """
@@ -74,17 +62,35 @@ class HashTable(MutableMapping):
             key (Any): Key to add or update
             value (Any): Value to associate with the key
         """
-        for index in self._probe_sequence(key):
-            item = self._table[index]
+        table = self._table
+        size = self._size
+        mask = size - 1
+        key_hash = hash(key)
+        index, step = self._probe_start(key_hash)
+        free_index = None
+        for _ in range(size):
+            item = table[index]
             if item is None:
-                self._table[index] = (key, value)
-                self._count += 1
-                return
-            elif item[0] == key:
-                self._table[index] = (key, value)
+                if free_index is None:
+                    free_index = index
+                break
+            elif item is _TOMBSTONE:
+                if free_index is None:
+                    free_index = index
+            elif item[0] == key_hash and item[1] == key:
+                table[index] = (key_hash, key, value)
                 return
-        self._rehash()
-        self._add(key, value)
+            index = (index + step) & mask
+
+        if free_index is None:
+            self._rehash()
+            self._add(key, value)
+            return
+
+        if table[free_index] is _TOMBSTONE:
+            self._tombstones -= 1
+        table[free_index] = (key_hash, key, value)
+        self._count += 1
 
     def _search(self, key: Any) -> Optional[Any]:
         """
@@ -96,10 +102,18 @@ class HashTable(MutableMapping):
         Returns:
             Optional[Any]: Value associated with the key, or None if not found
         """
-        for index in self._probe_sequence(key):
-            item = self._table[index]
-            if item is not None and item[0] == key:
-                return item[1]
+        table = self._table
+        size = self._size
+        mask = size - 1
+        key_hash = hash(key)
+        index, step = self._probe_start(key_hash)
+        for _ in range(size):
+            item = table[index]
+            if item is None:
+                return None
+            if item[0] == key_hash and item[1] == key:
+                return item[2]
+            index = (index + step) & mask
         return None
 
     def _remove(self, key: Any) -> bool:
@@ -112,28 +126,52 @@ class HashTable(MutableMapping):
         Returns:
             bool: True if key was found and removed, False otherwise
         """
-        for index in self._probe_sequence(key):
-            item = self._table[index]
-            if item is not None and item[0] == key:
-                self._table[index] = None
+        table = self._table
+        size = self._size
+        mask = size - 1
+        key_hash = hash(key)
+        index, step = self._probe_start(key_hash)
+        for _ in range(size):
+            item = table[index]
+            if item is None:
+                return False
+            if item[0] == key_hash and item[1] == key:
+                table[index] = _TOMBSTONE
                 self._count -= 1
+                self._tombstones += 1
                 return True
+            index = (index + step) & mask
         return False
 
     def _rehash(self) -> None:
         """
-        Rehash the table to a larger size when load factor is too high.
+        Rehash the table when load factor is too high.
+
+        The table doubles only if stored pairs make up most of the load. When
+        removed pair markers dominate, it is rebuilt at the same size, so
+        repeated insertions and deletions do not grow it without bound.
+
+        Stored hashes are reused and keys are known to be distinct, so every
+        pair goes to the first empty slot of its probe sequence without calling
+        hash() or comparing keys.
         """
         old_table = self._table
-        old_size = self._size
 
-        self._size = self._size * 2 + 1
-        self._table = [None] * self._size
-        self._count = 0
+        if self._count >= self._tombstones:
+            self._bits += 1
+            self._size = 1 << self._bits
+        table: List[Optional[Tuple[int, Any, Any]]] = [None] * self._size
+        self._table = table
+        self._tombstones = 0
+        mask = self._size - 1
 
         for item in old_table:
-            if item is not None:
-                self._add(item[0], item[1])
+            if item is None or item is _TOMBSTONE:
+                continue
+            index, step = self._probe_start(item[0])
+            while table[index] is not None:
+                index = (index + step) & mask
+            table[index] = item
 
     def __setitem__(self, key: Any, value: Any) -> None:
         """
@@ -143,7 +181,7 @@ class HashTable(MutableMapping):
             key (Any): Key to set
             value (Any): Value to associate with the key
         """
-        if self._count >= self._size * 0.75:
+        if self._count + self._tombstones >= self._size * 0.75:
             self._rehash()
         self._add(key, value)
 
@@ -198,8 +236,8 @@ class HashTable(MutableMapping):
             Iterator[Any]: Iterator of all keys
         """
         for item in self._table:
-            if item is not None:
-                yield item[0]
+            if item is not None and item is not _TOMBSTONE:
+                yield item[1]
 
     def __len__(self) -> int:
         """
@@ -3,19 +3,18 @@ Test module for matrix operations.
 Contains unit tests for matrix functions: addition, multiplication, transposition.
 """
 
-import sys
-import os
 
-current_dir = os.path.dirname(__file__)
-project_path = os.path.join(current_dir, "..", "..", "project", "task_1")
-sys.path.insert(0, os.path.abspath(project_path))
+import numpy as np
 
-from matrices import (
+from project.task_1.matrices import (
     calculate_matrix_sum,
     calculate_matrix_product,
     calculate_matrix_transpose,
 )
 
+ARRAY_A = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+ARRAY_B = np.array([[6.0, 5.0, 4.0], [3.0, 2.0, 1.0]])
+
 
 def test_calculate_matrix_sum():
     """
@@ -102,3 +101,105 @@ def test_calculate_matrix_transpose():
     column_vector = [[1.0], [2.0], [3.0]]
     expected_column_transpose = [[1.0, 2.0, 3.0]]
     assert calculate_matrix_transpose(column_vector) == expected_column_transpose
+
+
+def test_calculate_matrix_product_medium():
+    """
+    Test multiplication of matrices too large for the direct list product.
+
+    Test cases:
+    - 3x3 matrices multiplication
+    - Incompatible matrices (should return None)
+    """
+    matrix_a = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]]
+    matrix_b = [[9.0, 8.0, 7.0], [6.0, 5.0, 4.0], [3.0, 2.0, 1.0]]
+    expected_result = [[30.0, 24.0, 18.0], [84.0, 69.0, 54.0], [138.0, 114.0, 90.0]]
+    assert calculate_matrix_product(matrix_a, matrix_b) == expected_result
+
+    assert calculate_matrix_product(matrix_a, matrix_b[:2]) is None
+
+
+def test_calculate_matrix_product_large():
+    """
+    Test multiplication of large matrices computed with NumPy.
+
+    Test cases:
+    - Square matrices whose size is not a power of two
+    - Rectangular matrices
+    """
+    size = 130
+    matrix_a = [[float((i + j) % 7 - 3) for j in range(size)] for i in range(size)]
+    matrix_b = [[float((i * j) % 5 - 2) for j in range(size)] for i in range(size)]
+    expected_result = [
+        [sum(matrix_a[i][k] * matrix_b[k][j] for k in range(size)) for j in range(size)]
+        for i in range(size)
+    ]
+    assert calculate_matrix_product(matrix_a, matrix_b) == expected_result
+
+    matrix_c = [row[:129] for row in matrix_a]
+    matrix_d = matrix_b[:129]
+    expected_rectangular_result = [
+        [sum(matrix_c[i][k] * matrix_d[k][j] for k in range(129)) for j in range(size)]
+        for i in range(size)
+    ]
+    assert calculate_matrix_product(matrix_c, matrix_d) == expected_rectangular_result
+
+
+def test_calculate_matrix_product_rectangular_arrays():
+    """
+    Test multiplication of large rectangular arrays.
+
+    Test cases:
+    - Result matches the NumPy product
+    """
+    rng = np.random.default_rng(0)
+    array_a = rng.random((128, 300))
+    array_b = rng.random((300, 140))
+    assert np.allclose(calculate_matrix_product(array_a, array_b), array_a @ array_b)
+
+
+def test_calculate_matrix_product_rectangular():
+    """
+    Test multiplication of large rectangular matrices given as lists.
+
+    Test cases:
+    - Wide product with a short inner dimension
+    - Long inner dimension
+    """
+    rows, inner = 300, 20
+    matrix_a = [[float((i + k) % 7 - 3) for k in range(inner)] for i in range(rows)]
+    matrix_b = [[float((k * j) % 5 - 2) for j in range(rows)] for k in range(inner)]
+    expected_result = [
+        [
+            sum(matrix_a[i][k] * matrix_b[k][j] for k in range(inner))
+            for j in range(rows)
+        ]
+        for i in range(rows)
+    ]
+    assert calculate_matrix_product(matrix_a, matrix_b) == expected_result
+
+    matrix_c = [[float((i - k) % 3) for k in range(400)] for i in range(40)]
+    matrix_d = [[float((k + j) % 4 - 1) for j in range(70)] for k in range(400)]
+    expected_long_result = [
+        [sum(matrix_c[i][k] * matrix_d[k][j] for k in range(400)) for j in range(70)]
+        for i in range(40)
+    ]
+    assert calculate_matrix_product(matrix_c, matrix_d) == expected_long_result
+
+
+def test_matrix_operations_on_arrays():
+    """
+    Test that NumPy arrays are accepted as well as lists.
+
+    Test cases:
+    - Sum, product and transpose of arrays
+    - Incompatible arrays (should return None)
+    """
+    assert np.array_equal(calculate_matrix_sum(ARRAY_A, ARRAY_B), ARRAY_A + ARRAY_B)
+    assert np.array_equal(
+        calculate_matrix_product(ARRAY_A, ARRAY_B.T), ARRAY_A @ ARRAY_B.T
+    )
+    assert np.array_equal(calculate_matrix_transpose(ARRAY_A), ARRAY_A.T)
+
+    assert calculate_matrix_sum(ARRAY_A, ARRAY_B.T) is None
+    assert calculate_matrix_product(ARRAY_A, ARRAY_B) is None
@@ -4,16 +4,13 @@ Test module for vector operations.
 Contains unit tests for vector functions: scalar product, length calculation, angle between vectors.
 """
 
-import sys
-import os
 import math
 
-current_dir = os.path.dirname(__file__)
-project_path = os.path.join(current_dir, "..", "..", "project", "task_1")
-sys.path.insert(0, os.path.abspath(project_path))
+import numpy as np
 
-from vector import (
+from project.task_1.vector import (
     calculate_scalar_product,
+    calculate_scalar_product_sparse,
     calculate_vector_length,
     calculate_angle_between_vectors,
 )
@@ -120,3 +117,95 @@ def test_calculate_angle_between_vectors():
         expected_straight_angle,
         abs_tol=0.0001,
     )
+
+
+def test_vector_operations_on_long_vectors():
+    """
+    Test that long vectors and NumPy arrays give the same results as short lists.
+    """
+    first_vector = [float(i % 7) for i in range(200)]
+    second_vector = [float(i % 5) - 2.0 for i in range(200)]
+    expected_product = sum(x * y for x, y in zip(first_vector, second_vector))
+    assert math.isclose(
+        calculate_scalar_product(first_vector, second_vector), expected_product
+    )
+    assert math.isclose(
+        calculate_scalar_product(np.array(first_vector), np.array(second_vector)),
+        expected_product,
+    )
+    assert calculate_scalar_product(first_vector, second_vector[:-1]) is None
+
+    assert math.isclose(
+        calculate_vector_length(np.array(first_vector)),
+        math.sqrt(sum(x * x for x in first_vector)),
+    )
+
+    # Parallel long vectors must not fail on cosine rounding
+    scaled_vector = [3.0 * x for x in first_vector]
+    assert math.isclose(
+        calculate_angle_between_vectors(first_vector, scaled_vector),
+        0.0,
+        abs_tol=0.0001,
+    )
+
+
+def test_calculate_scalar_product_sparse():
+    """
+    Test sparse scalar product against the dense one.
+    """
+    first_dense = [0.0] * 50
+    second_dense = [0.0] * 50
+    for index, value in [(3, 2.0), (10, -1.5), (42, 4.0)]:
+        first_dense[index] = value
+    for index, value in [(42, 0.5), (3, 3.0), (7, 9.0)]:
+        second_dense[index] = value
+
+    assert calculate_scalar_product_sparse(
+        [3, 10, 42], [2.0, -1.5, 4.0], [42, 3, 7], [0.5, 3.0, 9.0]
+    ) == calculate_scalar_product(first_dense, second_dense)
+
+    # No common positions
+    assert calculate_scalar_product_sparse([1], [1.0], [2], [1.0]) == 0.0
+
+    # Indices and values of different lengths
+    assert calculate_scalar_product_sparse([1, 2], [1.0], [2], [1.0]) is None
+
+
+def test_calculate_vector_length_extreme_values():
+    """
+    Test that vector length does not overflow or underflow on extreme values.
+    """
+    assert math.isclose(calculate_vector_length([3e200, 4e200]), 5e200)
+    assert math.isclose(calculate_vector_length([3e-200, 4e-200]), 5e-200)
+
+
+def test_calculate_angle_between_vectors_extreme_values():
+    """
+    Test that the angle does not overflow or underflow on extreme values.
+    """
+    assert math.isclose(
+        calculate_angle_between_vectors([1e200, 0.0], [1e200, 1e200]), math.pi / 4
+    )
+    assert math.isclose(
+        calculate_angle_between_vectors([1e-200, 0.0], [0.0, 1e-200]), math.pi / 2
+    )
+    assert calculate_angle_between_vectors([math.inf, 0.0], [1.0, 1.0]) is None
+
+
+def test_long_vector_extreme_values():
+    """
+    Test that long vectors and arrays with extreme values keep finite results.
+    """
+    large = np.full(100, 1e200)
+    small = np.full(100, 1e-200)
+    assert math.isclose(calculate_vector_length(large), 1e201)
+    assert math.isclose(calculate_vector_length(small), 1e-199)
+    assert math.isclose(calculate_vector_length([1e200] * 100), 1e201)
+
+    tilted = large.copy()
+    tilted[0] = 0.0
+    expected = math.acos(99 / math.sqrt(99 * 100))
+    assert math.isclose(calculate_angle_between_vectors(large, tilted), expected)
+    assert math.isclose(
+        calculate_angle_between_vectors(small, small), 0.0, abs_tol=1e-7
+    )
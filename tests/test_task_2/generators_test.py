@@ -4,15 +4,11 @@ Contains unit tests for generator-based data processing functions.
 """
 
 import pytest
-import sys
-import os
 from functools import reduce
 
-current_dir = os.path.dirname(__file__)
-project_path = os.path.join(current_dir, "..", "..", "project", "task_2")
-sys.path.insert(0, os.path.abspath(project_path))
+import numpy as np
 
-from generators import (
+from project.task_2.generators import (
     create_data_stream,
     create_operation_adapter,
     apply_processing_pipeline,
@@ -78,6 +74,15 @@ def test_reduce_operation_adapter():
     assert result == [10]
 
 
+def test_reduce_operation_adapter_with_none_initializer():
+    """Test reduce operation adapter with an explicit None initializer."""
+    operation = create_operation_adapter(
+        reduce, lambda acc, x: x if acc is None else acc + x, None
+    )
+    assert list(operation(create_data_stream([]))) == [None]
+    assert list(operation(create_data_stream([1, 2, 3]))) == [6]
+
+
 def test_zip_operation_adapter():
     """Test zip operation adapter."""
     operation = create_operation_adapter(zip, [10, 20, 30])
@@ -170,3 +175,56 @@ def test_map_operation_parametrized(input_data, expected):
     result_stream = operation(data_stream)
     result = list(result_stream)
     assert result == expected
+
+
+def test_mixed_processing_pipeline(sample_numbers):
+    """Test pipeline mixing chained map/filter stages with other operations."""
+
+    def custom_duplicate(stream):
+        for item in stream:
+            yield item
+            yield item
+
+    operations = [
+        create_operation_adapter(map, lambda x: x * 10),
+        create_operation_adapter(filter, lambda x: x > 10),
+        create_operation_adapter(custom_duplicate),
+        create_operation_adapter(map, lambda x: x + 1),
+        create_operation_adapter(enumerate),
+    ]
+
+    data_stream = create_data_stream(sample_numbers)
+    result_stream = apply_processing_pipeline(data_stream, *operations)
+    result = list(result_stream)
+    assert result == list(enumerate([21, 21, 31, 31, 41, 41, 51, 51]))
+
+
+def test_numpy_processing_pipeline():
+    """Test pipeline over a NumPy array with ufunc and regular stages."""
+    operations = [
+        create_operation_adapter(map, np.square),
+        create_operation_adapter(filter, np.isfinite),
+        create_operation_adapter(filter, lambda x: x > 4),
+        create_operation_adapter(map, int),
+        create_operation_adapter(reduce, lambda x, y: x + y),
+    ]
+
+    data = np.array([1.0, 2.0, 3.0, np.inf, 4.0])
+    result_stream = apply_processing_pipeline(data, *operations)
+    assert list(result_stream) == [25]
+
+
+def test_numpy_pipeline_two_dimensional_filter():
+    """Test ufunc stages over a 2-D array work on rows like a lazy pipeline."""
+    data = np.array([[1.0], [np.inf], [2.0]])
+    operations = [create_operation_adapter(filter, np.isfinite)]
+    result = list(apply_processing_pipeline(data, *operations))
+    assert [row.tolist() for row in result] == [[1.0], [2.0]]
+
+
+def test_numpy_pipeline_multi_output_ufunc():
+    """Test a ufunc with several outputs yields a tuple per element."""
+    data = np.array([1.5, 2.25])
+    operations = [create_operation_adapter(map, np.modf)]
+    result = list(apply_processing_pipeline(data, *operations))
+    assert result == [(0.5, 1.0), (0.25, 2.0)]
@@ -1,11 +1,4 @@
-import sys
-import os
-
-current_dir = os.path.dirname(__file__)
-project_path = os.path.join(current_dir, "..", "..", "project", "task_3")
-sys.path.insert(0, os.path.abspath(project_path))
-
-from cache_decorator import decorator_cache
+from project.task_3.cache_decorator import decorator_cache
 
 
 def test_cache_basic_functionality():
@@ -60,6 +53,7 @@ def test_cache_with_keyword_arguments():
 
     Test cases:
     - Repeated calls with same keyword arguments use cache
+    - Keyword argument order does not matter
     - Positional and keyword calls are treated as different keys
     """
     call_count = 0
@@ -78,6 +72,9 @@ def test_cache_with_keyword_arguments():
     assert multiply(x=4, y=5) == 20
     assert call_count == 2
 
+    assert multiply(y=5, x=4) == 20
+    assert call_count == 2
+
 
 def test_cache_lru_eviction_policy():
     """
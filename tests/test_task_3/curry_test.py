@@ -3,15 +3,9 @@ Test module for currying functions.
 Contains unit tests for curry_explicit and uncurry_explicit functions.
 """
 
-import sys
-import os
 import pytest
 
-current_dir = os.path.dirname(__file__)
-project_path = os.path.join(current_dir, "..", "..", "project", "task_3")
-sys.path.insert(0, os.path.abspath(project_path))
-
-from curry import curry_explicit, uncurry_explicit
+from project.task_3.curry import curry_explicit, uncurry_explicit
 
 
 def test_curry_basic_functionality():
@@ -98,6 +92,28 @@ def test_curry_argument_validation():
         curried_zero(1)
 
 
+def test_curry_partial_application_reuse():
+    """
+    Test that a partially applied curried function can be reused.
+
+    Test cases:
+    - Completing the same intermediate function with different arguments
+    - Branching from an intermediate function several times
+    """
+
+    def join(a, b, c):
+        return a + b + c
+
+    curried = curry_explicit(join, 3)
+    prefix = curried("a")
+    assert prefix("b")("c") == "abc"
+    assert prefix("x")("y") == "axy"
+
+    branch = prefix("b")
+    assert branch("1") == "ab1"
+    assert branch("2") == "ab2"
+
+
 def test_curry_builtin_functions():
     """
     Test currying with built-in Python functions.
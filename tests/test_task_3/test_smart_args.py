@@ -4,14 +4,8 @@ Contains unit tests for Isolated and Evaluated argument markers.
 """
 
 import pytest
-import os
-import sys
 
-current_dir = os.path.dirname(__file__)
-project_path = os.path.join(current_dir, "..", "..", "project", "task_3")
-sys.path.insert(0, os.path.abspath(project_path))
-
-from smart_args import smart_args, isolated, evaluated
+from project.task_3.smart_args import smart_args, isolated, evaluated
 
 
 def test_isolated_creates_deep_copy():
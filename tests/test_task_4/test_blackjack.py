@@ -1,14 +1,16 @@
 import pytest
 from unittest.mock import patch, Mock
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
 from project.task_4.core import Card, Deck, Hand
 from project.task_4.players import PlayerBase, Player, Bot
-from project.task_4.game import Game
+from project.task_4.game import Game, _run_headless_game, run_batch
+from project.task_4.strategies import RandomPool, Strategy
 from project.task_4.enums import Suit, Rank, StrategyType
+from project.task_4.simulation import (
+    deck_composition,
+    dealer_distribution,
+    expected_value,
+)
 
 
 class TestCard:
@@ -58,6 +60,13 @@ class TestCard:
         assert card_k.is_same_rank(card_a) == False
         assert card_a.is_same_rank(card_2) == False
 
+    def test_card_from_code(self):
+        """Test decoding of packed card codes."""
+        assert str(Card.from_code(0)) == "2 of Hearts"
+        assert str(Card.from_code(12)) == "A of Hearts"
+        assert str(Card.from_code(51)) == "A of Spades"
+        assert Card.from_code(25) is Card.from_code(25)
+
 
 class TestDeck:
     """
@@ -73,6 +82,9 @@ class TestDeck:
         """Test that deck is initialized with 52 cards."""
         deck = Deck()
         assert len(deck.cards) == 52
+        assert all(isinstance(card, Card) for card in deck.cards)
+        with pytest.raises(AttributeError):
+            deck.cards.pop()
 
     def test_deck_deal_card(self):
         """Test that dealing a card reduces deck size and returns a Card instance."""
@@ -83,6 +95,13 @@ class TestDeck:
         assert isinstance(card, Card)
         assert len(deck.cards) == initial_count - 1
 
+    def test_deck_deals_every_card_once(self):
+        """Test that a full deck deals each of the 52 cards exactly once."""
+        deck = Deck()
+        dealt = {str(deck.deal_card()) for _ in range(52)}
+        assert len(dealt) == 52
+        assert deck.cards_remaining() == 0
+
     def test_deck_cards_remaining(self):
         """Test cards_remaining method returns correct count."""
         deck = Deck()
@@ -90,6 +109,86 @@ class TestDeck:
         deck.deal_card()
         assert deck.cards_remaining() == 51
 
+    def test_deck_deal_cards(self):
+        """Test dealing several cards matches dealing them one by one."""
+        deck = Deck()
+        expected = list(deck.cards[-3:][::-1])
+        assert deck.deal_cards(3) == expected
+        assert deck.cards_remaining() == 49
+
+        with pytest.raises(IndexError):
+            deck.deal_cards(50)
+
+    def test_deck_seed(self):
+        """Test decks with the same seed are shuffled the same way."""
+        assert Deck(seed=7).codes == Deck(seed=7).codes
+        assert sorted(Deck(seed=7).codes) == list(range(52))
+
+    def test_deck_reshuffle(self):
+        """Test reshuffle returns all dealt cards to the deck."""
+        deck = Deck()
+        for _ in range(30):
+            deck.deal_card()
+        deck.reshuffle()
+        assert deck.cards_remaining() == 52
+        assert sorted(deck.codes) == list(range(52))
+
+
+class TestRandomPool:
+    """
+    Test cases for the RandomPool class.
+    """
+
+    def test_randint_range(self):
+        """Test integers stay within inclusive bounds across batches."""
+        pool = RandomPool(batch_size=16)
+        values = {pool.randint(-2, 3) for _ in range(200)}
+        assert values == {-2, -1, 0, 1, 2, 3}
+
+    def test_randint_seed(self):
+        """Test pools with the same seed produce the same integers."""
+        first = RandomPool(batch_size=8, seed=5)
+        second = RandomPool(batch_size=8, seed=5)
+        assert [first.randint(0, 100) for _ in range(20)] == [
+            second.randint(0, 100) for _ in range(20)
+        ]
+
+    def test_random_floats(self):
+        """Test floats stay within bounds across batches and follow the seed."""
+        pool = RandomPool(batch_size=8, seed=3)
+        values = [pool.random() for _ in range(50)]
+        assert all(0.0 <= value < 1.0 for value in values)
+        assert all(2.0 <= pool.uniform(2.0, 5.0) < 5.0 for _ in range(50))
+
+        pool.reseed(3)
+        assert [pool.random() for _ in range(50)] == values
+
+
+def test_strategy_default_bet():
+    """Test strategies without their own betting rule bet a flat amount."""
+
+    class StandStrategy(Strategy):
+        def play(self, player, deck):
+            pass
+
+    assert StandStrategy().calculate_bet(PlayerBase("Test")) == 10
+
+
+def test_strategy_stops_hitting_on_bust():
+    """Test a strategy that always hits stops once the hand busts."""
+
+    class AlwaysHitStrategy(Strategy):
+        @staticmethod
+        def should_hit(score):
+            return True
+
+        def play(self, player, deck):
+            self._play_single_hand(player, player.hand, deck)
+
+    player = PlayerBase("Test")
+    AlwaysHitStrategy().play(player, Deck(seed=5))
+    assert player.hand.is_busted()
+
 
 class TestHand:
     """
@@ -120,6 +219,22 @@ class TestHand:
         assert len(hand.cards) == 1
         assert hand.cards[0] == card
 
+    def test_hand_add_cards(self):
+        """Test adding several cards at once matches adding them one by one."""
+        cards = [
+            Card(Suit.HEARTS, Rank.ACE),
+            Card(Suit.CLUBS, Rank.ACE),
+            Card(Suit.SPADES, Rank.NINE),
+            Card(Suit.DIAMONDS, Rank.KING),
+        ]
+        bulk = Hand()
+        bulk.add_cards(cards)
+        single = Hand()
+        for card in cards:
+            single.add_card(card)
+        assert bulk.cards == cards
+        assert bulk.get_score() == single.get_score() == 21
+
     def test_hand_blackjack_detection(self):
         """Test blackjack detection with ace and face card."""
         hand = Hand()
@@ -406,6 +521,33 @@ class TestGame:
 
         assert len(game.dealer.hand.cards) == 2
 
+    def test_deal_follows_list_changes(self, game):
+        """Test seats follow players and bots changed directly through the lists."""
+        game.bots.append(Bot("Extra Bot"))
+        game.players = []
+        game.deal_initial_cards()
+
+        assert len(game.bots[-1].hand.cards) == 2
+        assert game.get_final_winner().split(" with ")[0] in [
+            bot.name for bot in game.bots
+        ]
+
+    def test_seat_groups_cached(self, game):
+        """Test seat groups are reused until players or bots change."""
+        seats = game._seats
+        assert game._seats is seats
+
+        game.add_player(Player("NewPlayer"))
+        assert game._seats is not seats
+        assert game._seats[-2].name == "NewPlayer"
+
+        game.players[0].chips = 5
+        game.remove_bankrupt_players()
+        assert [player.name for player in game._participants] == [
+            "NewPlayer",
+            *(bot.name for bot in game.bots),
+        ]
+
     def test_remove_bankrupt_players(self, game):
         """Test removal of players with insufficient chips."""
         game.players[0].chips = 5
@@ -448,3 +590,95 @@ class TestGame:
             game._process_payout(player, player.hand, 17, False, 100)
 
         assert player.chips == 1150
+
+    def test_simulate_many(self):
+        """Test headless simulation counts every round once per bot."""
+        results = Game.simulate_many(1000, seed=3)
+        assert set(results) == {"Safe Bot", "Risk Taker Bot"}
+        for wins, pushes, losses in results.values():
+            assert wins + pushes + losses == 1000
+            assert 0 < wins < 1000 and 0 < losses < 1000
+
+        assert Game.simulate_many(1000, seed=3) == results
+
+    def test_simulate_many_custom_tables(self):
+        """Test simulation with given tables and more cards than one deck holds."""
+        always_hit = [True] * 32
+        tables = {f"Bot {i}": always_hit for i in range(6)}
+        results = Game.simulate_many(200, seed=4, hit_tables=tables)
+        assert set(results) == set(tables)
+        for wins, pushes, losses in results.values():
+            assert wins + pushes + losses == 200
+            assert losses > wins
+
+    def test_dealer_distribution(self):
+        """Test dealer outcome probabilities and expected value of standing."""
+        deck = Deck(seed=1)
+        up_card = Card(Suit.HEARTS, Rank.SIX)
+        distribution = dealer_distribution(up_card, deck_composition(deck.codes))
+        assert len(distribution) == 6
+        assert sum(distribution) == pytest.approx(1.0)
+
+        only_tens = (0, 0, 0, 0, 0, 0, 0, 0, 16, 0)
+        ten = Card(Suit.CLUBS, Rank.TEN)
+        assert dealer_distribution(ten, only_tens) == (0.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+        hand = Hand()
+        hand.add_card(Card(Suit.SPADES, Rank.KING))
+        hand.add_card(Card(Suit.SPADES, Rank.QUEEN))
+        assert expected_value(hand, ten, only_tens) == 0.0
+        hand.add_card(Card(Suit.DIAMONDS, Rank.TWO))
+        assert expected_value(hand, ten, only_tens) == -1.0
+
+    def test_expected_value_follows_game_rules(self):
+        """Test expected value uses the game's blackjack and charlie rules."""
+        only_tens = (0, 0, 0, 0, 0, 0, 0, 0, 16, 0)
+        ace = Card(Suit.CLUBS, Rank.ACE)
+
+        blackjack = Hand()
+        blackjack.add_cards([Card(Suit.SPADES, Rank.ACE), Card(Suit.SPADES, Rank.KING)])
+        assert expected_value(blackjack, ace, only_tens) == 0.0
+
+        three_card_21 = Hand()
+        three_card_21.add_cards(
+            [Card(Suit.SPADES, Rank.SEVEN), Card(Suit.HEARTS, Rank.SEVEN)]
+        )
+        three_card_21.add_card(Card(Suit.CLUBS, Rank.SEVEN))
+        assert expected_value(three_card_21, ace, only_tens) == -1.0
+
+        charlie = Hand()
+        charlie.add_cards([Card(Suit.SPADES, Rank.TWO)] * 5)
+        assert expected_value(charlie, ace, only_tens) == 1.0
+
+        ten = Card(Suit.CLUBS, Rank.TEN)
+        assert expected_value(blackjack, ten, only_tens) == 1.5
+
+    def test_player_stand_hint(self):
+        """Test a human player is shown the value of standing when the hole card is known."""
+        player = Player("Hinted")
+        player.hand.add_cards(
+            [Card(Suit.SPADES, Rank.KING), Card(Suit.HEARTS, Rank.QUEEN)]
+        )
+        with patch("builtins.input", return_value="stand"), patch(
+            "builtins.print"
+        ) as mock_print:
+            player.take_turn(
+                Deck(seed=2), Card(Suit.CLUBS, Rank.SIX), Card(Suit.CLUBS, Rank.TEN)
+            )
+
+        printed = [call.args[0] for call in mock_print.call_args_list]
+        assert any(line.startswith("Hint: standing is worth +") for line in printed)
+
+    def test_headless_game_is_deterministic(self):
+        """Test a headless game with a fixed seed always ends the same way."""
+        first = _run_headless_game((7, 3))
+        assert first == _run_headless_game((7, 3))
+        assert set(first) <= {"Safe Bot", "Risk Taker Bot", "Unpredictable Bot"}
+        assert all(value >= 0 for value in first.values())
+
+    def test_run_batch(self):
+        """Test worker processes play the same seeded games as in-process calls."""
+        assert run_batch(2, max_rounds=2, processes=2) == [
+            _run_headless_game((0, 2)),
+            _run_headless_game((1, 2)),
+        ]
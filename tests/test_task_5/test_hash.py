@@ -1,11 +1,4 @@
-import sys
-import os
-
-current_dir = os.path.dirname(__file__)
-project_path = os.path.join(current_dir, "..", "..", "project", "task_5")
-sys.path.insert(0, os.path.abspath(project_path))
-
-from hash import HashTable
+from project.task_5.hash import HashTable
 
 
 def test_hash_table_basic_functionality():
@@ -185,3 +178,59 @@ def test_hash_table_edge_cases():
 
     assert list(ht) == []
     assert len(ht) == 0
+
+
+def test_hash_table_deletion_keeps_probe_chains():
+    """
+    Tests deletion of keys that share a probe sequence.
+
+    Verifies:
+    - Keys inserted after a removed colliding key stay reachable
+    - Re-adding a removed key reuses its slot without duplicates
+    - Iteration skips removed keys
+    """
+
+    class CollidingKey:
+        def __init__(self, name):
+            self.name = name
+
+        def __hash__(self):
+            return 7
+
+        def __eq__(self, other):
+            return isinstance(other, CollidingKey) and self.name == other.name
+
+    ht = HashTable()
+    keys = [CollidingKey(name) for name in "abcd"]
+    for i, key in enumerate(keys):
+        ht[key] = i
+
+    del ht[keys[1]]
+    assert keys[1] not in ht
+    assert ht[keys[2]] == 2
+    assert ht[keys[3]] == 3
+
+    ht[keys[3]] = 30
+    ht[keys[1]] = 10
+    assert len(ht) == 4
+    assert sorted(key.name for key in ht) == ["a", "b", "c", "d"]
+    assert ht[keys[3]] == 30
+
+
+def test_hash_table_insert_delete_keeps_size():
+    """
+    Tests that removed pair markers do not make the table grow.
+
+    Verifies:
+    - Inserting and deleting many distinct keys keeps the table small
+    - Keys still present survive the in-place rebuilds
+    """
+    ht = HashTable()
+    ht["kept"] = "value"
+    for i in range(100_000):
+        ht[i] = i
+        del ht[i]
+
+    assert ht._size <= 16
+    assert len(ht) == 1
+    assert ht["kept"] == "value"